@@ -3,58 +3,124 @@ Keyboard input configuration for Spotlight.
 
 Centralizes all key bindings in one place for easy remapping.
 Decouples pygame key constants from application logic.
+
+pygame is imported lazily on first attribute access (PEP 562), so headless
+tools (e.g. `spotlight validate`) that merely import the config package never
+pay pygame's import cost.
 """
 
-import pygame
+import types
+
+
+def _init_bindings() -> None:
+    """Resolve all key constants. Runs once, on first attribute access."""
+    import pygame
+
+    g = globals()
+
+    # =========================================================================
+    # NAVIGATION KEYS
+    # =========================================================================
+
+    g["KEY_NEXT"] = pygame.K_RIGHT  # Navigate to next task
+    g["KEY_PREV"] = pygame.K_LEFT  # Navigate to previous task
+
+    # =========================================================================
+    # APPLICATION CONTROL
+    # =========================================================================
+
+    g["KEY_QUIT"] = pygame.K_ESCAPE  # Exit application
+
+    # =========================================================================
+    # GAME SHOW (WOW MODE)
+    # =========================================================================
 
-# =============================================================================
-# NAVIGATION KEYS
-# =============================================================================
+    # Team selection (1..9 supported)
+    g["KEY_TEAM_1"] = pygame.K_1
+    g["KEY_TEAM_2"] = pygame.K_2
+    g["KEY_TEAM_3"] = pygame.K_3
+    g["KEY_TEAM_4"] = pygame.K_4
+    g["KEY_TEAM_5"] = pygame.K_5
+    g["KEY_TEAM_6"] = pygame.K_6
+    g["KEY_TEAM_7"] = pygame.K_7
+    g["KEY_TEAM_8"] = pygame.K_8
+    g["KEY_TEAM_9"] = pygame.K_9
 
-KEY_NEXT = pygame.K_RIGHT  # Navigate to next task
-KEY_PREV = pygame.K_LEFT  # Navigate to previous task
+    # Award / penalty
+    g["KEY_AWARD"] = pygame.K_RETURN  # award difficulty points to buzzed/selected team
+    g["KEY_PENALTY"] = pygame.K_BACKSLASH  # subtract difficulty points
 
-# =============================================================================
-# APPLICATION CONTROL
-# =============================================================================
+    # Buzz-in
+    g["KEY_BUZZ_OPEN"] = pygame.K_b
+    g["KEY_BUZZ_RESET"] = pygame.K_r
+    g["KEY_BUZZ_FAIL"] = pygame.K_f  # mark current buzz-locked team as failed; reopen buzz and block them
 
-KEY_QUIT = pygame.K_ESCAPE  # Exit application
+    # Timer
+    g["KEY_TIMER_TOGGLE"] = pygame.K_SPACE
+    g["KEY_TIMER_RESET"] = pygame.K_BACKSPACE
 
-# =============================================================================
-# GAME SHOW (WOW MODE)
-# =============================================================================
+    # Overlays
+    g["KEY_TOGGLE_ROSTER"] = pygame.K_TAB
+    g["KEY_TOGGLE_HELP"] = pygame.K_h
 
-# Team selection (1..9 supported)
-KEY_TEAM_1 = pygame.K_1
-KEY_TEAM_2 = pygame.K_2
-KEY_TEAM_3 = pygame.K_3
-KEY_TEAM_4 = pygame.K_4
-KEY_TEAM_5 = pygame.K_5
-KEY_TEAM_6 = pygame.K_6
-KEY_TEAM_7 = pygame.K_7
-KEY_TEAM_8 = pygame.K_8
-KEY_TEAM_9 = pygame.K_9
+    # Tabu safety / reveals
+    g["KEY_TOGGLE_REVEAL"] = pygame.K_v  # toggle reveal (used e.g. for tabu placeholder)
 
-# Award / penalty
-KEY_AWARD = pygame.K_RETURN  # award difficulty points to buzzed/selected team
-KEY_PENALTY = pygame.K_BACKSLASH  # subtract difficulty points
+    # Persistence
+    g["KEY_SAVE"] = pygame.K_s
+    g["KEY_LOAD"] = pygame.K_l
 
-# Buzz-in
-KEY_BUZZ_OPEN = pygame.K_b
-KEY_BUZZ_RESET = pygame.K_r
-KEY_BUZZ_FAIL = pygame.K_f  # mark current buzz-locked team as failed; reopen buzz and block them
+    # =========================================================================
+    # FROZEN LOOKUP TABLES
+    # =========================================================================
 
-# Timer
-KEY_TIMER_TOGGLE = pygame.K_SPACE
-KEY_TIMER_RESET = pygame.K_BACKSPACE
+    # Immutable key -> action-name mapping, built once so hot event paths do a
+    # single dict probe instead of one module attribute lookup per KEY_*
+    # constant. Values are lowercased CommandType member names (see
+    # src.controllers.commands);
+    # this module deliberately stays pygame-only and does not import
+    # application code.
+    g["KEY_TO_COMMAND"] = types.MappingProxyType(
+        {
+            g["KEY_QUIT"]: "quit",
+            g["KEY_NEXT"]: "next",
+            g["KEY_PREV"]: "prev",
+            g["KEY_BUZZ_OPEN"]: "buzz_open",
+            g["KEY_BUZZ_RESET"]: "buzz_reset",
+            g["KEY_BUZZ_FAIL"]: "buzz_fail",
+            g["KEY_AWARD"]: "award",
+            g["KEY_PENALTY"]: "penalty",
+            g["KEY_TIMER_TOGGLE"]: "timer_toggle",
+            g["KEY_TIMER_RESET"]: "timer_reset",
+            g["KEY_TOGGLE_ROSTER"]: "toggle_roster",
+            g["KEY_TOGGLE_HELP"]: "toggle_help",
+            g["KEY_SAVE"]: "save",
+            g["KEY_LOAD"]: "load",
+            g["KEY_TOGGLE_REVEAL"]: "toggle_reveal",
+        }
+    )
 
-# Overlays
-KEY_TOGGLE_ROSTER = pygame.K_TAB
-KEY_TOGGLE_HELP = pygame.K_h
+    # Immutable key -> team index mapping for the 1..9 team keys.
+    g["KEY_TO_TEAM_INDEX"] = types.MappingProxyType(
+        {
+            g["KEY_TEAM_1"]: 0,
+            g["KEY_TEAM_2"]: 1,
+            g["KEY_TEAM_3"]: 2,
+            g["KEY_TEAM_4"]: 3,
+            g["KEY_TEAM_5"]: 4,
+            g["KEY_TEAM_6"]: 5,
+            g["KEY_TEAM_7"]: 6,
+            g["KEY_TEAM_8"]: 7,
+            g["KEY_TEAM_9"]: 8,
+        }
+    )
 
-# Tabu safety / reveals
-KEY_TOGGLE_REVEAL = pygame.K_v  # toggle reveal (used e.g. for tabu placeholder)
 
-# Persistence
-KEY_SAVE = pygame.K_s
-KEY_LOAD = pygame.K_l
+def __getattr__(name: str):
+    if name.startswith("KEY_"):
+        _init_bindings()
+        try:
+            return globals()[name]
+        except KeyError:
+            pass
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
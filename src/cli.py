@@ -22,6 +22,7 @@ from __future__ import annotations
 
 import argparse
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 from src.services.task_loader import TaskLoader, TaskLoadError
 
@@ -30,16 +31,32 @@ def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(prog="spotlight", description="Spotlight CLI")
     sub = parser.add_subparsers(dest="command", required=True)
 
-    validate = sub.add_parser("validate", help="Validate a tasks JSON file")
+    validate = sub.add_parser("validate", help="Validate one or more tasks JSON files")
     validate.add_argument(
         "--task-file",
-        default="data/tasks.json",
-        help="Path to tasks JSON file (default: data/tasks.json)",
+        action="append",
+        dest="task_files",
+        help="Path to tasks JSON file; repeatable (default: data/tasks.json)",
     )
 
     return parser
 
 
+def _write_stdout(text: str) -> None:
+    """Write pre-assembled output in one buffer-level write.
+
+    Bypasses print's per-call locking and incremental text encoding; falls
+    back to print when stdout has no binary buffer (some capture wrappers).
+    """
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        print(text, end="", flush=True)
+        return
+    sys.stdout.flush()
+    buffer.write(text.encode("utf-8"))
+    buffer.flush()
+
+
 def main(argv: list[str] | None = None) -> int:
     """CLI entry point.
 
@@ -50,18 +67,32 @@ def main(argv: list[str] | None = None) -> int:
     args = parser.parse_args(argv)
 
     if args.command == "validate":
-        try:
-            tasks = TaskLoader.load_tasks(args.task_file)
-        except TaskLoadError as e:
-            print(f"INVALID: {e}", file=sys.stderr)
-            return 2
-        except Exception as e:
-            # Defensive: never raise from CLI main
-            print(f"ERROR: Unexpected error: {e}", file=sys.stderr)
-            return 1
-
-        print(f"OK: {len(tasks)} tasks loaded from {args.task_file}")
-        return 0
+        task_files = args.task_files or ["data/tasks.json"]
+
+        # One worker per file, bounded; loads are read+parse, so a second
+        # file's I/O overlaps the first file's parsing. Results are
+        # collected in submission order for deterministic output.
+        with ThreadPoolExecutor(max_workers=min(32, len(task_files))) as pool:
+            futures = [pool.submit(TaskLoader.load_tasks, f) for f in task_files]
+
+            exit_code = 0
+            ok_lines: list[str] = []
+            for task_file, future in zip(task_files, futures):
+                try:
+                    tasks = future.result()
+                except TaskLoadError as e:
+                    print(f"INVALID: {e}", file=sys.stderr)
+                    exit_code = max(exit_code, 2)
+                except Exception as e:
+                    # Defensive: never raise from CLI main
+                    print(f"ERROR: Unexpected error: {e}", file=sys.stderr)
+                    exit_code = max(exit_code, 1)
+                else:
+                    ok_lines.append(f"OK: {len(tasks)} tasks loaded from {task_file}\n")
+
+        if ok_lines:
+            _write_stdout("".join(ok_lines))
+        return exit_code
 
     # Should not be reachable due to required=True on subparsers
     print("ERROR: Unknown command", file=sys.stderr)
@@ -6,37 +6,66 @@ This keeps pygame event handling decoupled from application logic.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from enum import Enum
+from enum import IntEnum, auto
 from typing import Optional
 
 
-class CommandType(str, Enum):
-    NEXT = "next"
-    PREV = "prev"
-    QUIT = "quit"
+class CommandType(IntEnum):
+    """Command identifiers.
 
-    SELECT_TEAM = "select_team"
-    AWARD = "award"
-    PENALTY = "penalty"
+    Contiguous small ints starting at 0 so dispatch tables can be plain
+    lists indexed by the member itself instead of hashing dict keys.
+    """
 
-    BUZZ_OPEN = "buzz_open"
-    BUZZ_RESET = "buzz_reset"
-    BUZZ = "buzz"
-    BUZZ_FAIL = "buzz_fail"
+    NEXT = 0
+    PREV = auto()
+    QUIT = auto()
 
-    TIMER_TOGGLE = "timer_toggle"
-    TIMER_RESET = "timer_reset"
+    SELECT_TEAM = auto()
+    AWARD = auto()
+    PENALTY = auto()
 
-    TOGGLE_ROSTER = "toggle_roster"
-    TOGGLE_HELP = "toggle_help"
+    BUZZ_OPEN = auto()
+    BUZZ_RESET = auto()
+    BUZZ = auto()
+    BUZZ_FAIL = auto()
 
-    TOGGLE_REVEAL = "toggle_reveal"
+    TIMER_TOGGLE = auto()
+    TIMER_RESET = auto()
 
-    SAVE = "save"
-    LOAD = "load"
+    TOGGLE_ROSTER = auto()
+    TOGGLE_HELP = auto()
 
+    TOGGLE_REVEAL = auto()
 
-@dataclass(frozen=True)
+    SAVE = auto()
+    LOAD = auto()
+
+
+@dataclass(frozen=True, slots=True)
 class Command:
     type: CommandType
     team_index: Optional[int] = None
+
+
+# Preallocated command instances. Command is frozen, so these canonical
+# instances can be shared instead of allocating a new one per keystroke.
+CMD_NEXT = Command(CommandType.NEXT)
+CMD_PREV = Command(CommandType.PREV)
+CMD_QUIT = Command(CommandType.QUIT)
+CMD_AWARD = Command(CommandType.AWARD)
+CMD_PENALTY = Command(CommandType.PENALTY)
+CMD_BUZZ_OPEN = Command(CommandType.BUZZ_OPEN)
+CMD_BUZZ_RESET = Command(CommandType.BUZZ_RESET)
+CMD_BUZZ_FAIL = Command(CommandType.BUZZ_FAIL)
+CMD_TIMER_TOGGLE = Command(CommandType.TIMER_TOGGLE)
+CMD_TIMER_RESET = Command(CommandType.TIMER_RESET)
+CMD_TOGGLE_ROSTER = Command(CommandType.TOGGLE_ROSTER)
+CMD_TOGGLE_HELP = Command(CommandType.TOGGLE_HELP)
+CMD_TOGGLE_REVEAL = Command(CommandType.TOGGLE_REVEAL)
+CMD_SAVE = Command(CommandType.SAVE)
+CMD_LOAD = Command(CommandType.LOAD)
+
+# Team-indexed commands pooled per team slot (1..9).
+CMD_SELECT_TEAM = tuple(Command(CommandType.SELECT_TEAM, team_index=i) for i in range(9))
+CMD_BUZZ = tuple(Command(CommandType.BUZZ, team_index=i) for i in range(9))
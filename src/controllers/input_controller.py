@@ -12,112 +12,197 @@ from __future__ import annotations
 import pygame
 
 from config import keybindings
-from src.controllers.commands import Command, CommandType
+from src.controllers.commands import (
+    CMD_AWARD,
+    CMD_BUZZ,
+    CMD_BUZZ_FAIL,
+    CMD_BUZZ_OPEN,
+    CMD_BUZZ_RESET,
+    CMD_LOAD,
+    CMD_NEXT,
+    CMD_PENALTY,
+    CMD_PREV,
+    CMD_QUIT,
+    CMD_SAVE,
+    CMD_SELECT_TEAM,
+    CMD_TIMER_RESET,
+    CMD_TIMER_TOGGLE,
+    CMD_TOGGLE_HELP,
+    CMD_TOGGLE_REVEAL,
+    CMD_TOGGLE_ROSTER,
+    Command,
+    CommandType,
+)
 from src.models.session import Session
 
+# Singleton lookup per stateless CommandType, used to materialize the key
+# dispatch table from the keybindings action names.
+_COMMAND_BY_TYPE: dict[CommandType, Command] = {
+    cmd.type: cmd
+    for cmd in (
+        CMD_QUIT,
+        CMD_NEXT,
+        CMD_PREV,
+        CMD_BUZZ_OPEN,
+        CMD_BUZZ_RESET,
+        CMD_BUZZ_FAIL,
+        CMD_AWARD,
+        CMD_PENALTY,
+        CMD_TIMER_TOGGLE,
+        CMD_TIMER_RESET,
+        CMD_TOGGLE_ROSTER,
+        CMD_TOGGLE_HELP,
+        CMD_SAVE,
+        CMD_LOAD,
+        CMD_TOGGLE_REVEAL,
+    )
+}
+
+
+# Window events that mean the OS may have damaged our pixels (restore,
+# expose, resize, alt-tab back); the application must do a full repaint
+# even though no game state changed.
+_WINDOW_DAMAGE_EVENTS = (
+    pygame.WINDOWSHOWN,
+    pygame.WINDOWEXPOSED,
+    pygame.WINDOWSIZECHANGED,
+    pygame.WINDOWMAXIMIZED,
+    pygame.WINDOWRESTORED,
+    pygame.WINDOWFOCUSGAINED,
+)
+
 
 class InputController:
     """Handles keyboard input and translates it into session/app commands."""
 
     def __init__(self, session: Session):
         self.session = session
-        self._buzz_open_mode = False
+        # Input mode: 0 = normal, 1 = buzz-open. Used as an index into the
+        # per-mode team command tables below, replacing a boolean branch.
+        self._mode = 0
+        self._team_cmd_by_mode = (CMD_SELECT_TEAM, CMD_BUZZ)
+        self._quit_requested = False
+
+        # When idle (no transition/animation running), poll_commands blocks in
+        # pygame.event.wait so the process sleeps instead of spinning at FPS.
+        # The Application toggles the flag each frame and sizes the timeout to
+        # the next scheduled wakeup (timer second tick, status expiry, ...).
+        self.idle = False
+        self.idle_timeout_ms = 16
+
+        # Raised when a window-damage event arrives; the Application reads
+        # and clears it to schedule a full repaint, since the dirty-rect
+        # idle path otherwise never redraws unchanged state.
+        self.window_damaged = False
+
+        # Filter events at the SDL level: slideshow mode only consumes QUIT,
+        # KEYDOWN and window-damage events, so discard mouse-motion/etc.
+        # events at insertion time instead of allocating Python event
+        # objects for them every frame.
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, *_WINDOW_DAMAGE_EVENTS])
+
+        # Precomputed key dispatch: built from the frozen keybindings tables
+        # so _map_keydown is a single dict lookup per event instead of a chain
+        # of comparisons. Command is frozen, so the instances are shared.
+        self._dispatch: dict[int, Command] = {
+            key: _COMMAND_BY_TYPE[CommandType[name.upper()]]
+            for key, name in keybindings.KEY_TO_COMMAND.items()
+        }
 
-    def poll_commands(self) -> tuple[bool, list[Command]]:
+        # Team selection / buzz: 1..9. pygame.K_1..K_9 are contiguous, so a
+        # range check plus subtraction replaces the dict probe entirely.
+        assert keybindings.KEY_TEAM_9 - keybindings.KEY_TEAM_1 == 8, (
+            "team keys are expected to be contiguous keycodes"
+        )
+        self._team_key_lo = keybindings.KEY_TEAM_1
+        self._team_key_hi = keybindings.KEY_TEAM_9
+
+    def poll_commands(self, events: list[pygame.event.Event] | None = None) -> tuple[bool, list[Command]]:
         """Process pending pygame events.
 
+        Args:
+            events: Optional pre-fetched event batch. When None, the queue is
+                pumped once and drained in bulk here.
+
         Returns:
             (running, commands)
         """
         commands: list[Command] = []
 
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                return False, [Command(CommandType.QUIT)]
-
-            if event.type == pygame.KEYDOWN:
+        # Bind hot pygame names locally: each loop iteration then uses fast
+        # LOAD_FAST lookups instead of repeated module attribute probes.
+        event_get = pygame.event.get
+        quit_type = pygame.QUIT
+        keydown_type = pygame.KEYDOWN
+        wanted_types = (quit_type, keydown_type, *_WINDOW_DAMAGE_EVENTS)
+
+        if events is None:
+            # One explicit pump per frame, then drain only the event types we
+            # handle, so SDL filters/copies in bulk instead of per-call.
+            pygame.event.pump()
+            events = event_get(wanted_types)
+
+            if self.idle and not events:
+                # Nothing happening: let the OS sleep us until an event
+                # arrives (or the idle timeout passes). Blocked event types
+                # are filtered at the SDL level, so wait() only wakes on
+                # relevant ones.
+                event = pygame.event.wait(timeout=self.idle_timeout_ms)
+                if event.type != pygame.NOEVENT:
+                    events = [event] + event_get(wanted_types)
+
+        self._quit_requested = False
+        nav_delta = 0
+        for event in events:
+            if event.type == quit_type:
+                return False, [CMD_QUIT]
+            elif event.type in _WINDOW_DAMAGE_EVENTS:
+                self.window_damaged = True
+            elif event.type == keydown_type:
                 cmd = self._map_keydown(event)
-                if cmd is not None:
-                    if cmd.type == CommandType.QUIT:
-                        return False, [cmd]
+                if cmd is None:
+                    continue
+                # Coalesce held-key autorepeat: only the net navigation
+                # position matters for what this frame will render.
+                if cmd.type == CommandType.NEXT:
+                    nav_delta += 1
+                elif cmd.type == CommandType.PREV:
+                    nav_delta -= 1
+                else:
                     commands.append(cmd)
 
-        return True, commands
+        if nav_delta != 0:
+            session = self.session
+            session.current_index = (session.current_index + nav_delta) % len(session.tasks)
+            commands.append(CMD_NEXT if nav_delta > 0 else CMD_PREV)
+
+        return not self._quit_requested, commands
 
     def _map_keydown(self, event: pygame.event.Event) -> Command | None:
         key = event.key
 
-        if key == keybindings.KEY_QUIT:
-            return Command(CommandType.QUIT)
-
-        if key == keybindings.KEY_NEXT:
-            self.session.next_task()
-            return Command(CommandType.NEXT)
-
-        if key == keybindings.KEY_PREV:
-            self.session.prev_task()
-            return Command(CommandType.PREV)
-
-        # Buzz-in open / reset
-        if key == keybindings.KEY_BUZZ_OPEN:
-            self._buzz_open_mode = True
-            return Command(CommandType.BUZZ_OPEN)
-
-        if key == keybindings.KEY_BUZZ_RESET:
-            self._buzz_open_mode = False
-            return Command(CommandType.BUZZ_RESET)
-
-        if key == keybindings.KEY_BUZZ_FAIL:
-            self._buzz_open_mode = False
-            return Command(CommandType.BUZZ_FAIL)
-
-        # Team selection / buzz: 1..9
-        team_keys = {
-            keybindings.KEY_TEAM_1: 0,
-            keybindings.KEY_TEAM_2: 1,
-            keybindings.KEY_TEAM_3: 2,
-            keybindings.KEY_TEAM_4: 3,
-            keybindings.KEY_TEAM_5: 4,
-            keybindings.KEY_TEAM_6: 5,
-            keybindings.KEY_TEAM_7: 6,
-            keybindings.KEY_TEAM_8: 7,
-            keybindings.KEY_TEAM_9: 8,
-        }
-        if key in team_keys:
-            team_index = team_keys[key]
-            if self._buzz_open_mode:
-                # First team number after opening buzz counts as "buzz".
-                # Application will decide whether it locks based on GameState.
-                self._buzz_open_mode = False
-                return Command(CommandType.BUZZ, team_index=team_index)
-            return Command(CommandType.SELECT_TEAM, team_index=team_index)
-
-        if key == keybindings.KEY_AWARD:
-            return Command(CommandType.AWARD)
-
-        if key == keybindings.KEY_PENALTY:
-            return Command(CommandType.PENALTY)
-
-        if key == keybindings.KEY_TIMER_TOGGLE:
-            return Command(CommandType.TIMER_TOGGLE)
-
-        if key == keybindings.KEY_TIMER_RESET:
-            return Command(CommandType.TIMER_RESET)
-
-        if key == keybindings.KEY_TOGGLE_ROSTER:
-            return Command(CommandType.TOGGLE_ROSTER)
-
-        if key == keybindings.KEY_TOGGLE_HELP:
-            return Command(CommandType.TOGGLE_HELP)
-
-        if key == keybindings.KEY_SAVE:
-            return Command(CommandType.SAVE)
-
-        if key == keybindings.KEY_LOAD:
-            return Command(CommandType.LOAD)
-
-        if key == keybindings.KEY_TOGGLE_REVEAL:
-            return Command(CommandType.TOGGLE_REVEAL)
+        cmd = self._dispatch.get(key)
+        if cmd is not None:
+            # Small switch for the stateful command types.
+            ctype = cmd.type
+            if ctype == CommandType.QUIT:
+                # Signal quit via the flag so poll_commands doesn't have to
+                # re-check every produced command for QUIT.
+                self._quit_requested = True
+                return None
+            if ctype == CommandType.BUZZ_OPEN:
+                self._mode = 1
+            elif ctype == CommandType.BUZZ_RESET or ctype == CommandType.BUZZ_FAIL:
+                self._mode = 0
+            return cmd
+
+        if self._team_key_lo <= key <= self._team_key_hi:
+            # In buzz-open mode the first team number counts as "buzz";
+            # the Application decides whether it locks based on GameState.
+            cmd = self._team_cmd_by_mode[self._mode][key - self._team_key_lo]
+            self._mode = 0
+            return cmd
 
         return None
 
@@ -11,6 +11,8 @@ import sys
 import pygame
 import time
 
+from collections import OrderedDict
+
 from config import settings
 from src.controllers.commands import CommandType
 from src.models.game_show import award_points_for_current_task
@@ -32,6 +34,7 @@ from src.views.tabu_renderer import TabuRenderer
 from src.views.discussion_renderer import DiscussionRenderer
 from src.views.code_renderer import CodeRenderer
 from src.views.explain_to_renderer import ExplainToRenderer
+from src.services.glow_effect import render_glow, warm_glow_cache
 from src.services.transitions import crossfade
 from src.services.transition_math import transition_progress
 from src.views.board_renderer import render_board
@@ -73,6 +76,7 @@ class Application:
 
         # Transition state
         self._frame_surface = None
+        self._transition_scratch = None
         self._transition_prev = None
         self._transition_next = None
         self._transition_start_ms = None
@@ -85,6 +89,27 @@ class Application:
         # Base slide cache (task content only, no dynamic overlays)
         self._base_frame = None
 
+        # LRU of rendered base slides keyed on (task_id, revealed). Revisits
+        # during circular navigation reuse the surface instead of re-rendering
+        # the slide; the idle-frame prefetch below fills it ahead of need.
+        # Both reveal variants can coexist, so toggling needs no invalidation.
+        self._base_cache: "OrderedDict[tuple[int, bool], pygame.Surface]" = OrderedDict()
+        self._base_cache_max = 16
+
+        # Dirty-rect overlay compositing (only used when rendering 1:1).
+        # Rects covered by overlays on the previous frame; restored from the
+        # base frame before redrawing so only overlay pixels move per frame.
+        self._prev_overlay_rects: list[pygame.Rect] = []
+        self._needs_full_blit = True
+        # Snapshot of the state the overlays rendered last; identical state
+        # means the frame on screen is already correct and can be kept as-is.
+        self._last_overlay_key: tuple | None = None
+
+        # Fonts for the dynamic overlays, shared across all task types so the
+        # overlay path never needs to resolve the current renderer.
+        self.overlay_font_small = None
+        self.overlay_font_tiny = None
+
         # Per-task reveal state
         self.reveal_state = RevealState()
 
@@ -95,6 +120,8 @@ class Application:
         self._render_canvas = None
         self._render_scale = 1.0
         self._display_size = None
+        # Preallocated destination for the downscale blit (UI_RENDER_SCALE > 1)
+        self._scaled_frame = None
 
         # Board state
         self._board_state_path = "data/board_state.json"
@@ -109,6 +136,32 @@ class Application:
         # App mode (board vs slideshow)
         self._app_mode: str = getattr(settings, "APP_MODE", "slideshow")
 
+        # Command dispatch: CommandType members are contiguous small ints, so
+        # a flat list indexed by cmd.type replaces both the old if/elif chain
+        # and a hashed dict probe. Unhandled types (NEXT/PREV/QUIT are acted
+        # on before _apply_command) stay None.
+        handlers: list = [None] * len(CommandType)
+        handlers[CommandType.TOGGLE_ROSTER] = self._cmd_toggle_roster
+        handlers[CommandType.TOGGLE_HELP] = self._cmd_toggle_help
+        handlers[CommandType.SELECT_TEAM] = self._cmd_select_team
+        handlers[CommandType.BUZZ] = self._cmd_buzz
+        handlers[CommandType.BUZZ_FAIL] = self._cmd_buzz_fail
+        handlers[CommandType.AWARD] = self._cmd_award
+        handlers[CommandType.PENALTY] = self._cmd_penalty
+        handlers[CommandType.BUZZ_OPEN] = self._cmd_buzz_open
+        handlers[CommandType.BUZZ_RESET] = self._cmd_buzz_reset
+        handlers[CommandType.TIMER_TOGGLE] = self._cmd_timer_toggle
+        handlers[CommandType.TIMER_RESET] = self._cmd_timer_reset
+        handlers[CommandType.SAVE] = self._cmd_save
+        handlers[CommandType.LOAD] = self._cmd_load
+        handlers[CommandType.TOGGLE_REVEAL] = self._cmd_toggle_reveal
+        self._command_handlers = handlers
+
+        # _render_frame is specialized: it points at the idle renderer and is
+        # swapped to the transition renderer while a crossfade is running, so
+        # the steady-state path never tests transition attributes.
+        self._render_frame = self._render_frame_idle
+
         # Debug instrumentation
         self._debug_enabled = bool(getattr(settings, "DEBUG", False))
         self._debug_last_tick_ms: int | None = None
@@ -136,6 +189,10 @@ class Application:
             self._cleanup()
 
     def _initialize(self) -> None:
+        # Start the task-file read before pygame/SDL init so the disk I/O
+        # overlaps it; load_tasks below picks up the prefetched bytes.
+        TaskLoader.prefetch(self.task_file)
+
         pygame.init()
 
         self._dbg("initialize: pygame.init done")
@@ -167,6 +224,9 @@ class Application:
             w, h = self._display_size
             rw, rh = int(w * self._render_scale), int(h * self._render_scale)
             self._render_canvas = pygame.Surface((rw, rh)).convert_alpha()
+            # Reused downscale target: smoothscale writes into this surface
+            # instead of allocating a fresh display-sized buffer per frame.
+            self._scaled_frame = pygame.Surface(self._display_size).convert()
         else:
             self._render_canvas = self.screen
 
@@ -213,9 +273,16 @@ class Application:
 
         # Offscreen surface for rendering frames (for transitions)
         # NOTE: transitions and renderers target the internal canvas size.
+        # convert_alpha keeps it (and every _base_frame copied from it) in
+        # the display pixel format, so frame blits are plain memory copies.
         self._frame_surface = pygame.Surface(self._render_canvas.get_size()).convert_alpha()
 
+        # Persistent crossfade destination: transition frames blend into this
+        # scratch surface instead of allocating a full-screen buffer each frame.
+        self._transition_scratch = pygame.Surface(self._frame_surface.get_size()).convert_alpha()
+
         self._init_renderers()
+        self._prewarm_glow_cache()
 
         # Render initial frame into the buffer
         self._last_task_index = self.session.current_index
@@ -240,8 +307,10 @@ class Application:
             return
 
         assert self._display_size is not None
-        scaled = pygame.transform.smoothscale(rendered, self._display_size)
-        self.screen.blit(scaled, (0, 0))
+        if self._scaled_frame is None:
+            self._scaled_frame = pygame.Surface(self._display_size).convert()
+        pygame.transform.smoothscale(rendered, self._display_size, self._scaled_frame)
+        self.screen.blit(self._scaled_frame, (0, 0))
 
     def _init_renderers(self) -> None:
         self.renderers = {
@@ -252,144 +321,225 @@ class Application:
             "explain_to": ExplainToRenderer(self._frame_surface),
         }
 
+        # The renderers share identical font settings; borrow one set for the
+        # overlays so drawing them is independent of the current task type
+        # (and still works on error slides with no matching renderer).
+        self.overlay_font_small = self.renderers["quiz"].font_small
+        self.overlay_font_tiny = self.renderers["quiz"].font_tiny
+
+    def _prewarm_glow_cache(self) -> None:
+        """Pre-generate the glow surface for every accent color in the session.
+
+        Runs once at load so the first frame showing a new accent color pays
+        a blit instead of the gradient render. Done synchronously on the main
+        thread: after the downsampled NumPy path a glow costs about a
+        millisecond, and the session uses only a handful of distinct colors,
+        so a background executor would add thread-safety questions around
+        pygame surfaces for no visible gain.
+        """
+        size = self._frame_surface.get_size()
+        seen = set()
+        for task in self.session.tasks:
+            renderer = self.renderers.get(task.type)
+            if renderer is None:
+                continue
+            cfg = renderer.get_glow_config(task)
+            if not isinstance(cfg, dict):
+                continue
+            color = cfg.get("color")
+            if color is None or color in seen:
+                continue
+            seen.add(color)
+            warm_glow_cache(size, color)
+
+    @staticmethod
+    def _coalesce_commands(commands: list) -> list:
+        """Compact one frame's command burst before applying.
+
+        Only the net effect matters within a single frame: paired overlay or
+        timer toggles cancel, only the last team selection sticks, and repeat
+        buzzes from one team are no-ops after the first. Bursts happen with
+        held keys or buzzer hardware; the common 0/1-command frame returns
+        immediately.
+        """
+        if len(commands) < 2:
+            return commands
+
+        out: list = []
+        select_pos: int | None = None
+        buzzed: set[int] = set()
+        toggle_pos: dict[CommandType, int | None] = {
+            CommandType.TOGGLE_ROSTER: None,
+            CommandType.TOGGLE_HELP: None,
+            CommandType.TIMER_TOGGLE: None,
+        }
+
+        for cmd in commands:
+            ctype = cmd.type
+            if ctype == CommandType.SELECT_TEAM:
+                if select_pos is not None:
+                    out[select_pos] = cmd
+                    continue
+                select_pos = len(out)
+                out.append(cmd)
+            elif ctype == CommandType.BUZZ:
+                if cmd.team_index in buzzed:
+                    continue
+                buzzed.add(cmd.team_index)
+                out.append(cmd)
+            elif ctype in toggle_pos:
+                pos = toggle_pos[ctype]
+                if pos is not None:
+                    # Second press cancels the first: drop the pair.
+                    out[pos] = None
+                    toggle_pos[ctype] = None
+                    continue
+                toggle_pos[ctype] = len(out)
+                out.append(cmd)
+            else:
+                out.append(cmd)
+
+        return [c for c in out if c is not None]
+
     def _apply_command(self, cmd, now_ms: int) -> None:
         assert self.game_state is not None
+        handler = self._command_handlers[cmd.type]
+        if handler is not None:
+            handler(cmd, now_ms)
 
-        # If an overlay is open, prioritize closing it.
-        if cmd.type == CommandType.TOGGLE_ROSTER:
-            self.show_roster = not self.show_roster
-            if self.show_roster:
-                self.show_help = False
-            return
+    # --- Command handlers (dispatched via _command_handlers) ---
+
+    def _cmd_toggle_roster(self, cmd, now_ms: int) -> None:
+        self.show_roster = not self.show_roster
+        if self.show_roster:
+            self.show_help = False
 
-        if cmd.type == CommandType.TOGGLE_HELP:
-            self.show_help = not self.show_help
-            if self.show_help:
-                self.show_roster = False
+    def _cmd_toggle_help(self, cmd, now_ms: int) -> None:
+        self.show_help = not self.show_help
+        if self.show_help:
+            self.show_roster = False
+
+    def _cmd_select_team(self, cmd, now_ms: int) -> None:
+        if not self.presentation.enable_game_show:
+            return
+        # Once a team buzzed and is locked-in, don't allow manual switching.
+        if self.game_state.buzz_state == self.game_state.buzz_state.LOCKED:
             return
+        if cmd.team_index is not None and 0 <= cmd.team_index < len(self.game_state.teams):
+            self.selected_team = cmd.team_index
+            self.game_state.set_status(f"Selected: {self.game_state.teams[cmd.team_index].name}", now_ms)
 
-        if cmd.type == CommandType.SELECT_TEAM:
-            if not self.presentation.enable_game_show:
-                return
-            # Once a team buzzed and is locked-in, don't allow manual switching.
-            if self.game_state.buzz_state == self.game_state.buzz_state.LOCKED:
-                return
-            if cmd.team_index is not None and 0 <= cmd.team_index < len(self.game_state.teams):
+    def _cmd_buzz(self, cmd, now_ms: int) -> None:
+        if not self.presentation.enable_game_show:
+            return
+        if cmd.team_index is not None:
+            if self.game_state.buzz(cmd.team_index, now_ms=now_ms):
+                # Auto-focus the buzzed team.
                 self.selected_team = cmd.team_index
-                self.game_state.set_status(f"Selected: {self.game_state.teams[cmd.team_index].name}", now_ms)
+                self._base_frame = None
 
-        elif cmd.type == CommandType.BUZZ:
-            if not self.presentation.enable_game_show:
-                return
-            if cmd.team_index is not None:
-                if self.game_state.buzz(cmd.team_index, now_ms=now_ms):
-                    # Auto-focus the buzzed team.
-                    self.selected_team = cmd.team_index
-                    self._base_frame = None
-
-        elif cmd.type == CommandType.BUZZ_FAIL:
-            if not self.presentation.enable_game_show:
-                return
-            # Reopen buzz and block the failing team for this task.
-            self.game_state.fail_locked_team_and_reopen(now_ms=now_ms)
-            self._base_frame = None
+    def _cmd_buzz_fail(self, cmd, now_ms: int) -> None:
+        if not self.presentation.enable_game_show:
+            return
+        # Reopen buzz and block the failing team for this task.
+        self.game_state.fail_locked_team_and_reopen(now_ms=now_ms)
+        self._base_frame = None
 
-        elif cmd.type == CommandType.AWARD:
-            if not self.presentation.enable_game_show:
-                return
-            task = self.session.current_task()
-            task_id = int(task.id) if task.id is not None else None
+    def _cmd_award(self, cmd, now_ms: int) -> None:
+        if not self.presentation.enable_game_show:
+            return
+        task = self.session.current_task()
+        task_id = int(task.id) if task.id is not None else None
 
-            if task_id is not None and self.scoring_state.is_awarded(task_id):
-                self.game_state.set_status("Already awarded", now_ms)
-                return
+        if task_id is not None and self.scoring_state.is_awarded(task_id):
+            self.game_state.set_status("Already awarded", now_ms)
+            return
 
-            # Determine who would receive points before trying.
-            target_team = self.game_state.buzz_locked_team
-            if target_team is None:
-                target_team = self.selected_team
+        # Determine who would receive points before trying.
+        target_team = self.game_state.buzz_locked_team
+        if target_team is None:
+            target_team = self.selected_team
 
-            if target_team is None:
-                self.game_state.set_status("No team selected", now_ms)
-                return
+        if target_team is None:
+            self.game_state.set_status("No team selected", now_ms)
+            return
 
-            if target_team in self.game_state.buzz_blocked_teams:
-                self.game_state.set_status(f"BLOCKED: {self.game_state.teams[target_team].name}", now_ms)
-                return
+        if self.game_state.is_team_blocked(target_team):
+            self.game_state.set_status(f"BLOCKED: {self.game_state.teams[target_team].name}", now_ms)
+            return
 
-            awarded_team = award_points_for_current_task(self.session, self.game_state, self.selected_team, now_ms)
-            if awarded_team is None:
-                return
+        awarded_team = award_points_for_current_task(self.session, self.game_state, self.selected_team, now_ms)
+        if awarded_team is None:
+            return
 
-            # Only now we lock the task as awarded.
-            if task_id is not None:
-                self.scoring_state.mark_awarded(task_id)
+        # Only now we lock the task as awarded.
+        if task_id is not None:
+            self.scoring_state.mark_awarded(task_id)
 
-            # After a successful award, close the buzzer lock.
-            self.game_state.reset_buzz(now_ms)
+        # After a successful award, close the buzzer lock.
+        self.game_state.reset_buzz(now_ms)
 
-        elif cmd.type == CommandType.PENALTY:
-            if not self.presentation.enable_game_show:
-                return
-            task = self.session.current_task()
-            assert task.points is not None
-            points = int(task.points)
-
-            team_index = self.game_state.buzz_locked_team
-            if team_index is None:
-                team_index = self.selected_team
-            if team_index is None:
-                self.game_state.set_status("No team selected", now_ms)
-            else:
-                # Penalties also don't apply to blocked teams (handled by GameState.add_points)
-                self.game_state.add_points(team_index, -points, now_ms=now_ms)
+    def _cmd_penalty(self, cmd, now_ms: int) -> None:
+        if not self.presentation.enable_game_show:
+            return
+        task = self.session.current_task()
+        assert task.points is not None
+        points = int(task.points)
+
+        team_index = self.game_state.buzz_locked_team
+        if team_index is None:
+            team_index = self.selected_team
+        if team_index is None:
+            self.game_state.set_status("No team selected", now_ms)
+        else:
+            # Penalties also don't apply to blocked teams (handled by GameState.add_points)
+            self.game_state.add_points(team_index, -points, now_ms=now_ms)
 
-        elif cmd.type == CommandType.BUZZ_OPEN:
-            if not self.presentation.enable_game_show:
-                return
-            self.game_state.open_buzz(now_ms)
+    def _cmd_buzz_open(self, cmd, now_ms: int) -> None:
+        if not self.presentation.enable_game_show:
+            return
+        self.game_state.open_buzz(now_ms)
 
-        elif cmd.type == CommandType.BUZZ_RESET:
-            if not self.presentation.enable_game_show:
-                return
-            self.game_state.reset_buzz(now_ms)
+    def _cmd_buzz_reset(self, cmd, now_ms: int) -> None:
+        if not self.presentation.enable_game_show:
+            return
+        self.game_state.reset_buzz(now_ms)
 
-        elif cmd.type == CommandType.TIMER_TOGGLE:
-            self.game_state.timer_start_pause_toggle(now_ms)
+    def _cmd_timer_toggle(self, cmd, now_ms: int) -> None:
+        self.game_state.timer_start_pause_toggle(now_ms)
 
-        elif cmd.type == CommandType.TIMER_RESET:
-            self.game_state.timer_reset(now_ms)
+    def _cmd_timer_reset(self, cmd, now_ms: int) -> None:
+        self.game_state.timer_reset(now_ms)
 
-        elif cmd.type == CommandType.SAVE:
-            if not self.presentation.enable_game_show:
-                self.game_state.set_status("Save disabled in presenter mode", now_ms)
-                return
-            try:
-                save_state(self._game_state_path, self.game_state)
-                self.game_state.set_status("Saved", now_ms)
-            except GameStateStoreError as e:
-                self.game_state.set_status(str(e), now_ms)
-
-        elif cmd.type == CommandType.LOAD:
-            if not self.presentation.enable_game_show:
-                self.game_state.set_status("Load disabled in presenter mode", now_ms)
-                return
-            try:
-                self.game_state = load_state(self._game_state_path)
-                # Clamp selection
-                self.selected_team = min(self.selected_team or 0, len(self.game_state.teams) - 1)
-                self.game_state.set_status("Loaded", now_ms)
-            except GameStateStoreError as e:
-                self.game_state.set_status(str(e), now_ms)
-
-        elif cmd.type == CommandType.TOGGLE_REVEAL:
-            task = self.session.current_task()
-            if task.id is not None:
-                revealed = self.reveal_state.toggle(int(task.id))
-                self.game_state.set_status("Revealed" if revealed else "Hidden", now_ms)
-                # Base slide content changed (notes and/or Tabu placeholder).
-                self._base_frame = None
+    def _cmd_save(self, cmd, now_ms: int) -> None:
+        if not self.presentation.enable_game_show:
+            self.game_state.set_status("Save disabled in presenter mode", now_ms)
             return
+        try:
+            save_state(self._game_state_path, self.game_state)
+            self.game_state.set_status("Saved", now_ms)
+        except GameStateStoreError as e:
+            self.game_state.set_status(str(e), now_ms)
+
+    def _cmd_load(self, cmd, now_ms: int) -> None:
+        if not self.presentation.enable_game_show:
+            self.game_state.set_status("Load disabled in presenter mode", now_ms)
+            return
+        try:
+            self.game_state = load_state(self._game_state_path)
+            # Clamp selection
+            self.selected_team = min(self.selected_team or 0, len(self.game_state.teams) - 1)
+            self.game_state.set_status("Loaded", now_ms)
+        except GameStateStoreError as e:
+            self.game_state.set_status(str(e), now_ms)
+
+    def _cmd_toggle_reveal(self, cmd, now_ms: int) -> None:
+        task = self.session.current_task()
+        if task.id is not None:
+            revealed = self.reveal_state.toggle(int(task.id))
+            self.game_state.set_status("Revealed" if revealed else "Hidden", now_ms)
+            # Base slide content changed (notes and/or Tabu placeholder).
+            self._base_frame = None
 
     def _game_loop(self) -> None:
         running = True
@@ -414,11 +564,37 @@ class Application:
                 if not running:
                     break
             else:
+                # Allow the controller to block while no animation is active,
+                # sized to the next scheduled wakeup: the timer only changes
+                # its displayed value at second boundaries and the status
+                # message at its expiry, so nothing needs redrawing sooner.
+                idle = self._transition_start_ms is None and self._slide_flash_start_ms is None
+                timeout_ms = 500
+                if idle and self.game_state is not None:
+                    gs = self.game_state
+                    if gs.timer.running:
+                        timeout_ms = min(timeout_ms, max(1, 1000 - (gs.timer.elapsed_ms % 1000)))
+                    if gs.status_until_ms is not None:
+                        timeout_ms = min(timeout_ms, max(1, gs.status_until_ms - now_ms))
+                self.input_controller.idle = idle
+                self.input_controller.idle_timeout_ms = timeout_ms
                 running, commands = self.input_controller.poll_commands()
                 if not running:
                     break
-
-            if self.game_state is not None:
+                # poll_commands may have slept in event.wait for up to
+                # timeout_ms; resample so tick/apply/render see the
+                # post-wait time instead of a stale pre-wait stamp (the
+                # timeout sizing above intentionally used the old sample).
+                now_ms = pygame.time.get_ticks()
+
+                if self.input_controller.window_damaged:
+                    # The OS invalidated our pixels (restore/expose/resize);
+                    # the unchanged-state skip in the idle renderer must not
+                    # hold back the repaint.
+                    self.input_controller.window_damaged = False
+                    self._needs_full_blit = True
+
+            if self.game_state is not None and self.game_state.needs_tick():
                 self.game_state.tick(now_ms)
 
             if self._app_mode == "board":
@@ -438,12 +614,19 @@ class Application:
                     self._blit_to_screen(self._render_canvas)
                 pygame.display.flip()
             else:
-                for cmd in commands:
+                for cmd in self._coalesce_commands(commands):
                     if self.game_state is not None:
                         self._apply_command(cmd, now_ms)
 
-                self._render_frame()
-                pygame.display.flip()
+                # _render_frame handles the display update itself (full flip
+                # or partial pygame.display.update of dirty rects).
+                self._maybe_start_transition(now_ms)
+                self._render_frame(now_ms)
+
+                # While nothing animates, use the spare frame budget to
+                # pre-render the neighboring slides for instant navigation.
+                if self._transition_start_ms is None and self._slide_flash_start_ms is None:
+                    self._prefetch_neighbor_slide()
 
             self.clock.tick(settings.FPS)
 
@@ -453,9 +636,12 @@ class Application:
         self._render_overlay(base)
         return base
 
-    def _render_frame(self) -> None:
-        """Render current frame for slideshow mode, including transitions."""
-        # Detect task change and start a transition.
+    def _maybe_start_transition(self, now_ms: int) -> None:
+        """Detect a task change and start the crossfade transition.
+
+        Starting a transition also swaps _render_frame over to the
+        transition-specialized method; it swaps itself back when done.
+        """
         if self.session.current_index != self._last_task_index:
             prev_task = self.session.tasks[self._last_task_index]
             if prev_task.id is not None:
@@ -469,11 +655,13 @@ class Application:
                 self.game_state.clear_buzz_blocks()
 
             prev = self._base_frame or self._render_base_slide()
-            self._base_frame = self._render_base_slide()
+            # Usually a cache hit: either the idle-frame prefetch got here
+            # first or the task was visited before.
+            self._base_frame = self._base_slide_cached()
 
             self._transition_prev = prev
             self._transition_next = self._base_frame
-            self._transition_start_ms = pygame.time.get_ticks()
+            self._transition_start_ms = now_ms
             self._last_task_index = self.session.current_index
 
             # Start short flash cue (accent color of next task)
@@ -488,22 +676,23 @@ class Application:
             except Exception:
                 self._slide_flash_color = settings.COLOR_BORDER
 
-        # If a transition is active, blend base slides
-        if (
-            self._transition_start_ms is not None
-            and self._transition_prev is not None
-            and self._transition_next is not None
-        ):
-            elapsed = pygame.time.get_ticks() - self._transition_start_ms
+            self._render_frame = self._render_frame_transition
+
+    def _render_frame_transition(self, now_ms: int) -> None:
+        """Render one crossfade frame; active only while a transition runs."""
+        if self._transition_start_ms is not None:
+            elapsed = now_ms - self._transition_start_ms
             duration = max(1, int(settings.FADE_DURATION))
             progress = transition_progress(elapsed, duration)
 
-            blended = crossfade(self._transition_prev, self._transition_next, progress)
-            self._render_overlay(blended)
+            blended = crossfade(
+                self._transition_prev, self._transition_next, progress, out=self._transition_scratch
+            )
+            self._prev_overlay_rects = self._render_overlay(blended)
 
             # Slide flash cue
             if self._slide_flash_start_ms is not None:
-                flash_elapsed = pygame.time.get_ticks() - self._slide_flash_start_ms
+                flash_elapsed = now_ms - self._slide_flash_start_ms
                 flash_duration = int(getattr(settings, "SLIDE_FLASH_DURATION", 0) or 0)
                 if flash_duration > 0 and flash_elapsed < flash_duration:
                     alpha_max = int(getattr(settings, "SLIDE_FLASH_ALPHA", 0) or 0)
@@ -519,16 +708,111 @@ class Application:
                     self._slide_flash_start_ms = None
 
             self._blit_to_screen(blended)
+            pygame.display.flip()
 
             if progress >= 1.0:
                 self._transition_start_ms = None
                 self._transition_prev = None
+                self._render_frame = self._render_frame_idle
+            # Transition frames always redraw everything, so the on-screen
+            # overlays match the state sampled this frame.
+            self._last_overlay_key = self._overlay_state_key()
         else:
-            if self._base_frame is None:
-                self._base_frame = self._render_base_slide()
-            frame = self._base_frame.copy()
-            self._render_overlay(frame)
+            # Defensive: transition state was torn down externally.
+            self._render_frame = self._render_frame_idle
+            self._render_frame_idle(now_ms)
+
+    def _render_frame_idle(self, now_ms: int) -> None:
+        """Render the steady-state (no transition) slideshow frame."""
+        if self._base_frame is None:
+            self._base_frame = self._base_slide_cached()
+            self._needs_full_blit = True
+
+        if self._render_scale > 1.0:
+            # Supersampled path: the smoothscale consumes the whole frame
+            # anyway, so compose base + overlays and scale as one unit.
+            # Still skip the recomposite when nothing changed on screen.
+            key = self._overlay_state_key()
+            if not self._needs_full_blit and key == self._last_overlay_key:
+                return
+            # Composite into the persistent canvas instead of copying the
+            # base frame into a fresh surface: same one blit, no per-frame
+            # full-screen allocation.
+            frame = self._render_canvas
+            frame.blit(self._base_frame, (0, 0))
+            self._prev_overlay_rects = self._render_overlay(frame)
             self._blit_to_screen(frame)
+            pygame.display.flip()
+            self._needs_full_blit = False
+            self._last_overlay_key = key
+        elif self._needs_full_blit:
+            self.screen.blit(self._base_frame, (0, 0))
+            self._prev_overlay_rects = self._render_overlay(self.screen)
+            pygame.display.flip()
+            self._needs_full_blit = False
+            self._last_overlay_key = self._overlay_state_key()
+        else:
+            # Skip redrawing when nothing the overlays read has changed;
+            # the frame on screen is already correct.
+            key = self._overlay_state_key()
+            if key == self._last_overlay_key:
+                return
+
+            # Steady state: restore only the pixels the previous overlays
+            # covered, redraw overlays, and push just those regions.
+            restore_rects = self._prev_overlay_rects
+            for rect in restore_rects:
+                self.screen.blit(self._base_frame, rect, rect)
+            new_rects = self._render_overlay(self.screen)
+            pygame.display.update(restore_rects + new_rects)
+            self._prev_overlay_rects = new_rects
+            self._last_overlay_key = key
+
+    def _base_slide_cached(self) -> pygame.Surface:
+        """Return the current task's base slide, via the LRU when possible."""
+        task = self.session.current_task()
+        if task.id is None:
+            return self._render_base_slide()
+
+        key = (int(task.id), self.reveal_state.is_revealed(int(task.id)))
+        surface = self._base_cache.get(key)
+        if surface is None:
+            surface = self._render_base_slide()
+            self._base_cache[key] = surface
+            if len(self._base_cache) > self._base_cache_max:
+                self._base_cache.popitem(last=False)
+        else:
+            self._base_cache.move_to_end(key)
+        return surface
+
+    def _prefetch_neighbor_slide(self) -> None:
+        """Pre-render at most one missing neighbor slide into the LRU.
+
+        Runs on idle frames only. Rendering happens on the main thread (pygame
+        surfaces and fonts are not safe to touch from a worker), but spread
+        one slide per frame it never blocks input handling noticeably.
+        """
+        n = len(self.session.tasks)
+        if n <= 1:
+            return
+
+        cur = self.session.current_index
+        for idx in ((cur + 1) % n, (cur - 1) % n):
+            task = self.session.tasks[idx]
+            if task.id is None:
+                continue
+            key = (int(task.id), self.reveal_state.is_revealed(int(task.id)))
+            if key in self._base_cache:
+                continue
+
+            try:
+                self.session.current_index = idx
+                self._base_cache[key] = self._render_base_slide()
+            finally:
+                self.session.current_index = cur
+            if len(self._base_cache) > self._base_cache_max:
+                self._base_cache.popitem(last=False)
+            break
 
     def _render_base_slide(self) -> pygame.Surface:
         """Render current task (static content) to an offscreen surface and return a copy.
@@ -562,7 +846,6 @@ class Application:
                         self._frame_surface.fill(settings.COLOR_BACKGROUND)
                         glow_config = renderer.get_glow_config(current_task)
                         if glow_config:
-                            from src.services.glow_effect import render_glow
                             render_glow(self._frame_surface, glow_config['color'], glow_config.get('cache_key'))
                         renderer.render_content(current_task, hidden=True)
                         renderer._render_footer(position_info)
@@ -574,7 +857,6 @@ class Application:
                     renderer.screen.fill(settings.COLOR_BACKGROUND)
                     glow_cfg = renderer.get_glow_config(current_task)
                     if glow_cfg is not None:
-                        from src.services.glow_effect import render_glow
                         render_glow(renderer.screen, glow_cfg["color"], glow_cfg.get("cache_key"))
                     renderer.render_content(current_task, show_note=show_note)
                     renderer._render_footer(position_info)
@@ -582,7 +864,6 @@ class Application:
                     renderer.screen.fill(settings.COLOR_BACKGROUND)
                     glow_cfg = renderer.get_glow_config(current_task)
                     if glow_cfg is not None:
-                        from src.services.glow_effect import render_glow
                         render_glow(renderer.screen, glow_cfg["color"], glow_cfg.get("cache_key"))
                     renderer.render_content(current_task, show_note=show_note)
                     renderer._render_footer(position_info)
@@ -590,7 +871,6 @@ class Application:
                     renderer.screen.fill(settings.COLOR_BACKGROUND)
                     glow_cfg = renderer.get_glow_config(current_task)
                     if glow_cfg is not None:
-                        from src.services.glow_effect import render_glow
                         render_glow(renderer.screen, glow_cfg["color"], glow_cfg.get("cache_key"))
                     renderer.render_content(current_task, show_note=show_note)
                     renderer._render_footer(position_info)
@@ -599,34 +879,72 @@ class Application:
 
         return self._frame_surface.copy()
 
-    def _render_overlay(self, target_surface: pygame.Surface) -> None:
-        """Draw dynamic game overlays onto the given surface."""
+    def _overlay_state_key(self) -> tuple | None:
+        """Snapshot everything the overlays read, at display granularity.
+
+        Two frames with equal keys render pixel-identical overlays, so a
+        matching key lets _render_frame skip the redraw entirely. The timer
+        is sampled at whole seconds because that is what draw_timer shows.
+        """
+        gs = self.game_state
+        if gs is None:
+            return None
+
+        timer = gs.timer
+        shown_ms = timer.elapsed_ms
+        if timer.mode.value == "countdown" and timer.remaining_ms() is not None:
+            shown_ms = timer.remaining_ms() or 0
+
+        return (
+            tuple((t.name, t.score) for t in gs.teams),
+            self.selected_team,
+            gs.buzz_state,
+            gs.buzz_locked_team,
+            timer.running,
+            shown_ms // 1000,
+            gs.status_message,
+            self.show_roster,
+            self.show_help,
+            self.session.current_index,
+            self.presentation.enable_game_show,
+        )
+
+    def _render_overlay(self, target_surface: pygame.Surface) -> list[pygame.Rect]:
+        """Draw dynamic game overlays onto the given surface.
+
+        Returns:
+            List of dirty rects covering everything drawn (for partial updates).
+        """
         if self.game_state is None:
-            return
+            return []
 
-        current_task = self.session.current_task()
-        renderer = self.renderers.get(current_task.type)
-        if renderer is None:
-            return
+        font_small = self.overlay_font_small
+        font_tiny = self.overlay_font_tiny
+
+        rects: list[pygame.Rect | None] = []
 
         if self.presentation.enable_game_show:
-            draw_scoreboard(target_surface, renderer.font_small, self.game_state, self.selected_team)
-            draw_buzz_status(target_surface, renderer.font_tiny, self.game_state)
+            rects.append(draw_scoreboard(target_surface, font_small, self.game_state, self.selected_team))
+            rects.append(draw_buzz_status(target_surface, font_tiny, self.game_state))
 
-        draw_timer(target_surface, renderer.font_small, self.game_state)
-        draw_status_message(target_surface, renderer.font_small, self.game_state)
-        draw_help_hint(target_surface, renderer.font_tiny)
+        rects.append(draw_timer(target_surface, font_small, self.game_state))
+        rects.append(draw_status_message(target_surface, font_small, self.game_state))
+        rects.append(draw_help_hint(target_surface, font_tiny))
 
         if self.show_roster:
-            draw_roster_overlay(target_surface, renderer.font_small, self.session)
+            rects.append(draw_roster_overlay(target_surface, font_small, self.session))
         if self.show_help:
-            draw_help_overlay(
-                target_surface,
-                renderer.font_small,
-                enable_game_show=self.presentation.enable_game_show,
-                enable_board=False,
+            rects.append(
+                draw_help_overlay(
+                    target_surface,
+                    font_small,
+                    enable_game_show=self.presentation.enable_game_show,
+                    enable_board=False,
+                )
             )
 
+        return [r for r in rects if r is not None]
+
     def _poll_board_events(self, now_ms: int) -> bool:
         assert self.game_state is not None
 
@@ -888,7 +1206,6 @@ class Application:
                 self._frame_surface.fill(settings.COLOR_BACKGROUND)
                 glow_config = renderer.get_glow_config(current_task)
                 if glow_config:
-                    from src.services.glow_effect import render_glow
                     render_glow(self._frame_surface, glow_config['color'], glow_config.get('cache_key'))
                 renderer.render_content(current_task, hidden=True)
                 renderer._render_footer(position_info)
@@ -896,7 +1213,6 @@ class Application:
             renderer.screen.fill(settings.COLOR_BACKGROUND)
             glow_cfg = renderer.get_glow_config(current_task)
             if glow_cfg is not None:
-                from src.services.glow_effect import render_glow
                 render_glow(renderer.screen, glow_cfg["color"], glow_cfg.get("cache_key"))
             renderer.render_content(current_task, show_note=show_note)
             renderer._render_footer(position_info)
@@ -904,7 +1220,6 @@ class Application:
             renderer.screen.fill(settings.COLOR_BACKGROUND)
             glow_cfg = renderer.get_glow_config(current_task)
             if glow_cfg is not None:
-                from src.services.glow_effect import render_glow
                 render_glow(renderer.screen, glow_cfg["color"], glow_cfg.get("cache_key"))
             renderer.render_content(current_task, show_note=show_note)
             renderer._render_footer(position_info)
@@ -912,7 +1227,6 @@ class Application:
             renderer.screen.fill(settings.COLOR_BACKGROUND)
             glow_cfg = renderer.get_glow_config(current_task)
             if glow_cfg is not None:
-                from src.services.glow_effect import render_glow
                 render_glow(renderer.screen, glow_cfg["color"], glow_cfg.get("cache_key"))
             renderer.render_content(current_task, show_note=show_note)
             renderer._render_footer(position_info)
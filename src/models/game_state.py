@@ -43,13 +43,25 @@ class TimerMode(str, Enum):
     COUNTDOWN = "countdown"
 
 
-@dataclass
+# Precomputed string -> member tables for from_dict: one dict lookup replaces
+# the tuple membership scan plus the Enum value-construction call (which walks
+# the class's value map under a lock on older Pythons).
+_STR_TO_BUZZ = {member.value: member for member in BuzzState}
+_STR_TO_TIMER = {member.value: member for member in TimerMode}
+
+# Reverse tables for to_dict: indexing skips the Python-level Enum.value
+# descriptor on every save.
+_BUZZ_TO_STR = {member: member.value for member in BuzzState}
+_TIMER_TO_STR = {member: member.value for member in TimerMode}
+
+
+@dataclass(slots=True)
 class Team:
     name: str
     score: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Timer:
     mode: TimerMode = TimerMode.STOPWATCH
     running: bool = False
@@ -92,9 +104,15 @@ class Timer:
         self.reset()
 
     def tick(self, now_ms: int) -> None:
+        # Hot path (called every frame while running): _accumulate is inlined
+        # here to skip the extra call frame and attribute reloads.
         if not self.running:
             return
-        self._accumulate(now_ms)
+        last = self._last_start_ms
+        if last is not None:
+            delta = now_ms - last
+            if delta > 0:
+                self.elapsed_ms += delta
         self._last_start_ms = now_ms
 
     def remaining_ms(self) -> Optional[int]:
@@ -116,15 +134,17 @@ class Timer:
         self.elapsed_ms += delta
 
 
-@dataclass
+@dataclass(slots=True)
 class GameState:
     teams: List[Team]
     buzz_state: BuzzState = BuzzState.CLOSED
     buzz_locked_team: Optional[int] = None
     timer: Timer = field(default_factory=Timer)
 
-    # Teams blocked from buzzing for the current task (by team index)
-    buzz_blocked_teams: set[int] = field(default_factory=set)
+    # Teams blocked from buzzing for the current task, packed as a bitmask
+    # (bit i set = team i blocked). With at most a handful of teams this is
+    # one int instead of a set, and membership is a single AND.
+    buzz_blocked_mask: int = 0
 
     # Transient UI hints (e.g., “Saved”, “Loaded”, “Buzz OPEN”)
     status_message: Optional[str] = None
@@ -152,7 +172,7 @@ class GameState:
             return
 
         # If a team is blocked for the current task, they can't receive points.
-        if team_index in self.buzz_blocked_teams:
+        if self.buzz_blocked_mask & (1 << team_index):
             if now_ms is not None:
                 self.set_status(f"BLOCKED: {self.teams[team_index].name}", now_ms)
             return
@@ -163,11 +183,13 @@ class GameState:
             self.set_status(f"{self.teams[team_index].name} {sign}{points}", now_ms)
 
     def reset_scores(self, now_ms: Optional[int] = None) -> None:
-        for t in self.teams:
-            t.score = 0
+        # Rebuild in one list comp (score defaults to 0) instead of N
+        # attribute stores; slice-assign keeps the list identity for anyone
+        # holding a reference.
+        self.teams[:] = [Team(name=t.name) for t in self.teams]
         self.buzz_state = BuzzState.CLOSED
         self.buzz_locked_team = None
-        self.buzz_blocked_teams.clear()
+        self.buzz_blocked_mask = 0
         self.timer.reset()
         if now_ms is not None:
             self.set_status("Scores reset", now_ms)
@@ -182,7 +204,7 @@ class GameState:
     def reset_buzz(self, now_ms: Optional[int] = None) -> None:
         self.buzz_state = BuzzState.CLOSED
         self.buzz_locked_team = None
-        self.buzz_blocked_teams.clear()
+        self.buzz_blocked_mask = 0
         if now_ms is not None:
             self.set_status("BUZZ RESET", now_ms)
 
@@ -190,24 +212,27 @@ class GameState:
         """Mark the currently locked team as failed and reopen buzz.
 
         The failed team is blocked from buzzing again until caller clears
-        buzz_blocked_teams (typically on task change).
+        the blocks (typically on task change).
         """
         if self.buzz_locked_team is not None:
-            self.buzz_blocked_teams.add(self.buzz_locked_team)
+            self.buzz_blocked_mask |= 1 << self.buzz_locked_team
         self.buzz_state = BuzzState.OPEN
         self.buzz_locked_team = None
         if now_ms is not None:
             self.set_status("BUZZ REOPEN", now_ms)
 
     def clear_buzz_blocks(self) -> None:
-        self.buzz_blocked_teams.clear()
+        self.buzz_blocked_mask = 0
+
+    def is_team_blocked(self, team_index: int) -> bool:
+        return bool(self.buzz_blocked_mask & (1 << team_index))
 
     def buzz(self, team_index: int, now_ms: Optional[int] = None) -> bool:
         if self.buzz_state != BuzzState.OPEN:
             return False
         if not (0 <= team_index < len(self.teams)):
             return False
-        if team_index in self.buzz_blocked_teams:
+        if self.buzz_blocked_mask & (1 << team_index):
             if now_ms is not None:
                 self.set_status(f"BLOCKED: {self.teams[team_index].name}", now_ms)
             return False
@@ -230,9 +255,63 @@ class GameState:
         self.timer.reset()
         self.set_status("Timer reset", now_ms)
 
+    def needs_tick(self) -> bool:
+        """Whether tick() would do any work right now.
+
+        Only a running timer and a pending status expiry are time-driven;
+        the game loop skips tick() entirely on all other frames.
+        """
+        return self.timer.running or self.status_until_ms is not None
+
     def tick(self, now_ms: int) -> None:
         self.timer.tick(now_ms)
-        self.clear_expired_status(now_ms)
+        # clear_expired_status inlined: per-frame path, the extra call frame
+        # and repeated attribute loads are pure overhead here.
+        until = self.status_until_ms
+        if until is not None and now_ms >= until:
+            self.status_until_ms = None
+            self.status_message = None
+
+    # --- command application ---
+    def apply(self, command: str, params: Optional[Dict[str, Any]] = None, now_ms: Optional[int] = None) -> Any:
+        """Apply a named command through the regular mutators.
+
+        Single entry point for driving the state machine from recorded data:
+        a stream of (command, params, now_ms) entries replays deterministically
+        because every mutator already takes its time source as an argument.
+
+        Raises:
+            ValueError: if the command name is unknown.
+        """
+        handler = _COMMAND_HANDLERS.get(command)
+        if handler is None:
+            raise ValueError(f"Unknown command: {command}")
+        return handler(self, params or {}, now_ms)
+
+    # --- checkpointing ---
+    def clone(self) -> "GameState":
+        """Return an independent copy of this state.
+
+        Cheap direct field copies (no dict round-trip through
+        to_dict/from_dict), intended for checkpoints: callers can keep the
+        clone and later restore by swapping it back in. Mutating either
+        state never affects the other.
+        """
+        return GameState(
+            teams=[Team(name=t.name, score=t.score) for t in self.teams],
+            buzz_state=self.buzz_state,
+            buzz_locked_team=self.buzz_locked_team,
+            timer=Timer(
+                mode=self.timer.mode,
+                running=self.timer.running,
+                elapsed_ms=self.timer.elapsed_ms,
+                target_ms=self.timer.target_ms,
+                _last_start_ms=self.timer._last_start_ms,
+            ),
+            buzz_blocked_mask=self.buzz_blocked_mask,
+            status_message=self.status_message,
+            status_until_ms=self.status_until_ms,
+        )
 
     # --- persistence ---
     def to_dict(self) -> Dict[str, Any]:
@@ -240,11 +319,11 @@ class GameState:
             "version": 1,
             "teams": [{"name": t.name, "score": t.score} for t in self.teams],
             "buzz": {
-                "state": self.buzz_state.value,
+                "state": _BUZZ_TO_STR[self.buzz_state],
                 "locked_team": self.buzz_locked_team,
             },
             "timer": {
-                "mode": self.timer.mode.value,
+                "mode": _TIMER_TO_STR[self.timer.mode],
                 "running": self.timer.running,
                 "elapsed_ms": self.timer.elapsed_ms,
                 "target_ms": self.timer.target_ms,
@@ -278,8 +357,9 @@ class GameState:
         if isinstance(buzz, dict):
             state = buzz.get("state", BuzzState.CLOSED.value)
             locked_team = buzz.get("locked_team")
-            if state in (BuzzState.CLOSED.value, BuzzState.OPEN.value, BuzzState.LOCKED.value):
-                gs.buzz_state = BuzzState(state)
+            buzz_member = _STR_TO_BUZZ.get(state) if isinstance(state, str) else None
+            if buzz_member is not None:
+                gs.buzz_state = buzz_member
             if locked_team is None or isinstance(locked_team, int):
                 gs.buzz_locked_team = locked_team
 
@@ -290,8 +370,9 @@ class GameState:
             elapsed_ms = timer.get("elapsed_ms", 0)
             target_ms = timer.get("target_ms")
 
-            if mode in (TimerMode.STOPWATCH.value, TimerMode.COUNTDOWN.value):
-                gs.timer.mode = TimerMode(mode)
+            timer_member = _STR_TO_TIMER.get(mode) if isinstance(mode, str) else None
+            if timer_member is not None:
+                gs.timer.mode = timer_member
             if isinstance(running, bool):
                 gs.timer.running = False  # restored as paused; caller can start
             if isinstance(elapsed_ms, int) and elapsed_ms >= 0:
@@ -307,3 +388,24 @@ class GameState:
 
         return gs
 
+
+# Command name -> normalized handler for GameState.apply(). Each entry adapts
+# the uniform (state, params, now_ms) calling convention to the mutator's own
+# signature; the table is built once at import time so apply() is a single
+# dict lookup.
+_COMMAND_HANDLERS = {
+    "add_points": lambda gs, p, now: gs.add_points(p["team_index"], p["points"], now_ms=now),
+    "reset_scores": lambda gs, p, now: gs.reset_scores(now_ms=now),
+    "open_buzz": lambda gs, p, now: gs.open_buzz(now_ms=now),
+    "reset_buzz": lambda gs, p, now: gs.reset_buzz(now_ms=now),
+    "fail_locked_team_and_reopen": lambda gs, p, now: gs.fail_locked_team_and_reopen(now_ms=now),
+    "clear_buzz_blocks": lambda gs, p, now: gs.clear_buzz_blocks(),
+    "buzz": lambda gs, p, now: gs.buzz(p["team_index"], now_ms=now),
+    "timer_start_pause_toggle": lambda gs, p, now: gs.timer_start_pause_toggle(now),
+    "timer_reset": lambda gs, p, now: gs.timer_reset(now),
+    "set_status": lambda gs, p, now: gs.set_status(
+        p["message"], now, duration_ms=p.get("duration_ms", 2000)
+    ),
+    "tick": lambda gs, p, now: gs.tick(now),
+}
+
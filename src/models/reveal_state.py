@@ -9,6 +9,9 @@ Contract
 - reset(task_id): sets to hidden.
 
 Side effects: stores state in-memory only.
+
+Task ids are small non-negative ints, so the state is a single int used as a
+bitmask: membership is one AND, toggle one XOR, and clearing resets to 0.
 """
 
 from __future__ import annotations
@@ -16,21 +19,18 @@ from __future__ import annotations
 
 class RevealState:
     def __init__(self) -> None:
-        self._revealed: set[int] = set()
+        self._mask: int = 0
 
     def is_revealed(self, task_id: int) -> bool:
-        return task_id in self._revealed
+        return bool(self._mask & (1 << task_id))
 
     def toggle(self, task_id: int) -> bool:
-        if task_id in self._revealed:
-            self._revealed.remove(task_id)
-            return False
-        self._revealed.add(task_id)
-        return True
+        bit = 1 << task_id
+        self._mask ^= bit
+        return bool(self._mask & bit)
 
     def reset(self, task_id: int) -> None:
-        self._revealed.discard(task_id)
+        self._mask &= ~(1 << task_id)
 
     def clear_all(self) -> None:
-        self._revealed.clear()
-
+        self._mask = 0
@@ -8,6 +8,8 @@ Contract:
 - reset(task_id): clear for a task.
 
 Side effects: in-memory only.
+
+Stored as an int bitmask indexed by task id, same as RevealState.
 """
 
 from __future__ import annotations
@@ -15,20 +17,20 @@ from __future__ import annotations
 
 class ScoringState:
     def __init__(self) -> None:
-        self._awarded: set[int] = set()
+        self._mask: int = 0
 
     def is_awarded(self, task_id: int) -> bool:
-        return task_id in self._awarded
+        return bool(self._mask & (1 << task_id))
 
     def mark_awarded(self, task_id: int) -> bool:
-        if task_id in self._awarded:
+        bit = 1 << task_id
+        if self._mask & bit:
             return False
-        self._awarded.add(task_id)
+        self._mask |= bit
         return True
 
     def reset(self, task_id: int) -> None:
-        self._awarded.discard(task_id)
+        self._mask &= ~(1 << task_id)
 
     def clear_all(self) -> None:
-        self._awarded.clear()
-
+        self._mask = 0
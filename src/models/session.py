@@ -7,7 +7,7 @@ Implements circular navigation (wrapping at start/end).
 Design principle: State object with no rendering or input logic.
 """
 
-from typing import List
+from typing import List, Tuple
 from src.models.task import BaseTask
 
 
@@ -35,34 +35,61 @@ class Session:
         """
         if not tasks:
             raise ValueError("Cannot create session with empty task list")
-        
-        self.tasks = tasks
-        self.current_index = 0
-    
+
+        # Immutable after construction; a tuple makes that explicit and
+        # keeps indexing on the cheapest path.
+        self.tasks: Tuple[BaseTask, ...] = tuple(tasks)
+        self._current_index = 0
+        self._current = self.tasks[0]
+        # Cached task count: the sequence is fixed after construction, so
+        # navigation avoids a len() call (and modulo) per step.
+        self._n = len(self.tasks)
+        # Precomputed position labels: there are only _n distinct values, so
+        # per-frame HUD queries reuse the same string instead of formatting.
+        self._position_labels = tuple(f"{i + 1} / {self._n}" for i in range(self._n))
+
+    @property
+    def current_index(self) -> int:
+        """Index of the currently displayed task (0-based)."""
+        return self._current_index
+
+    @current_index.setter
+    def current_index(self, index: int) -> None:
+        self._current_index = index
+        self._current = self.tasks[index]
+
     def next_task(self) -> None:
         """
         Navigate to the next task.
-        
+
         Wraps around to first task if currently at the end.
         """
-        self.current_index = (self.current_index + 1) % len(self.tasks)
-    
+        i = self._current_index + 1
+        if i == self._n:
+            i = 0
+        self._current_index = i
+        self._current = self.tasks[i]
+
     def prev_task(self) -> None:
         """
         Navigate to the previous task.
-        
+
         Wraps around to last task if currently at the start.
         """
-        self.current_index = (self.current_index - 1) % len(self.tasks)
-    
+        i = self._current_index - 1
+        if i < 0:
+            i = self._n - 1
+        self._current_index = i
+        self._current = self.tasks[i]
+
     def current_task(self) -> BaseTask:
         """
         Get the currently active task.
-        
+
         Returns:
             The task object at current_index
         """
-        return self.tasks[self.current_index]
+        return self._current
     
     def get_position_info(self) -> str:
         """
@@ -71,12 +98,12 @@ class Session:
         Returns:
             String like "3 / 12" indicating current position and total
         """
-        return f"{self.current_index + 1} / {len(self.tasks)}"
+        return self._position_labels[self._current_index]
     
     def is_first_task(self) -> bool:
         """Check if currently at first task."""
-        return self.current_index == 0
+        return self._current_index == 0
     
     def is_last_task(self) -> bool:
         """Check if currently at last task."""
-        return self.current_index == len(self.tasks) - 1
+        return self._current_index == self._n - 1
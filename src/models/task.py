@@ -11,7 +11,7 @@ from dataclasses import dataclass
 from typing import List, Optional, Dict, Any
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BaseTask:
     """Base class for all task types.
 
@@ -34,7 +34,7 @@ class BaseTask:
     difficulty: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class QuizTask(BaseTask):
     """
     Quiz question task.
@@ -50,7 +50,7 @@ class QuizTask(BaseTask):
     note: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TabuTask(BaseTask):
     """
     Tabu/Explain task.
@@ -66,7 +66,7 @@ class TabuTask(BaseTask):
     forbidden_words: List[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DiscussionTask(BaseTask):
     """
     Open discussion/Spotlight task.
@@ -82,7 +82,7 @@ class DiscussionTask(BaseTask):
     spotlight_duration: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CodeTask(BaseTask):
     """
     Code analysis task.
@@ -101,7 +101,7 @@ class CodeTask(BaseTask):
     note: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ExplainToTask(BaseTask):
     """
     Explain-to-audience task.
@@ -192,10 +192,108 @@ class TaskFactory:
         # Required for all tasks (Option A) so board mode can always be used.
         TaskFactory._require_non_empty_str(data, "category")
 
+    @classmethod
+    def _common_validate(cls, data: Dict[str, Any], task_type: str) -> None:
+        """Checks shared by every task type, run after the per-type fields."""
+        cls._require_category(data)
+        cls._require_points(data)
+
+        # Reject fields no constructor would accept (previously surfaced as a
+        # TypeError from the ** unpacking).
+        extra = data.keys() - cls._ALLOWED_FIELDS[task_type]
+        if extra:
+            raise ValueError(
+                f"Invalid data for {task_type} task: unexpected fields: {', '.join(sorted(extra))}"
+            )
+
+    @classmethod
+    def _build_quiz(cls, data: Dict[str, Any], task_id: int) -> "QuizTask":
+        cls._require_non_empty_str(data, "question")
+        cls._optional_str(data, "note")
+        cls._common_validate(data, "quiz")
+        return QuizTask(
+            type="quiz",
+            id=task_id,
+            points=data["points"],
+            category=data["category"],
+            difficulty=data.get("difficulty"),
+            question=data["question"],
+            note=data.get("note"),
+        )
+
+    @classmethod
+    def _build_tabu(cls, data: Dict[str, Any], task_id: int) -> "TabuTask":
+        cls._require_non_empty_str(data, "topic")
+        cls._require_str_list(data, "forbidden_words")
+        cls._common_validate(data, "tabu")
+        return TabuTask(
+            type="tabu",
+            id=task_id,
+            points=data["points"],
+            category=data["category"],
+            difficulty=data.get("difficulty"),
+            topic=data["topic"],
+            forbidden_words=data["forbidden_words"],
+        )
+
+    @classmethod
+    def _build_discussion(cls, data: Dict[str, Any], task_id: int) -> "DiscussionTask":
+        cls._require_non_empty_str(data, "prompt")
+        cls._optional_str(data, "spotlight_duration")
+        cls._common_validate(data, "discussion")
+        return DiscussionTask(
+            type="discussion",
+            id=task_id,
+            points=data["points"],
+            category=data["category"],
+            difficulty=data.get("difficulty"),
+            prompt=data["prompt"],
+            spotlight_duration=data.get("spotlight_duration"),
+        )
+
+    @classmethod
+    def _build_code(cls, data: Dict[str, Any], task_id: int) -> "CodeTask":
+        cls._require_non_empty_str(data, "code")
+        cls._require_non_empty_str(data, "question")
+        cls._optional_str(data, "note")
+        cls._common_validate(data, "code")
+        return CodeTask(
+            type="code",
+            id=task_id,
+            points=data["points"],
+            category=data["category"],
+            difficulty=data.get("difficulty"),
+            code=data["code"],
+            question=data["question"],
+            note=data.get("note"),
+        )
+
+    @classmethod
+    def _build_explain_to(cls, data: Dict[str, Any], task_id: int) -> "ExplainToTask":
+        cls._require_non_empty_str(data, "topic")
+        cls._require_non_empty_str(data, "audience")
+        cls._optional_str(data, "note")
+        cls._common_validate(data, "explain_to")
+        return ExplainToTask(
+            type="explain_to",
+            id=task_id,
+            points=data["points"],
+            category=data["category"],
+            difficulty=data.get("difficulty"),
+            topic=data["topic"],
+            audience=data["audience"],
+            note=data.get("note"),
+        )
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any], task_id: int) -> BaseTask:
         """Create a task object from dictionary data.
 
+        Dispatches to one precomputed builder per task type; each builder
+        validates its required fields and constructs the dataclass with
+        explicit keyword arguments, avoiding the old elif ladder plus
+        dict-copy/**-unpack per task.
+
         Args:
             data: Dictionary containing task data (typically from JSON)
             task_id: Unique identifier to assign to the task
@@ -214,43 +312,32 @@ class TaskFactory:
         if not isinstance(task_type, str) or not task_type.strip():
             raise ValueError("Field 'type' must be a non-empty string")
 
-        if task_type not in cls._TASK_CLASSES:
+        builder = cls._BUILDERS.get(task_type)
+        if builder is None:
             raise ValueError(
                 f"Unknown task type: {task_type}. "
                 f"Valid types: {', '.join(cls._TASK_CLASSES.keys())}"
             )
 
-        # Per-type validation for required fields
-        if task_type == "quiz":
-            cls._require_non_empty_str(data, "question")
-            cls._optional_str(data, "note")
-        elif task_type == "tabu":
-            cls._require_non_empty_str(data, "topic")
-            cls._require_str_list(data, "forbidden_words")
-        elif task_type == "discussion":
-            cls._require_non_empty_str(data, "prompt")
-            cls._optional_str(data, "spotlight_duration")
-        elif task_type == "code":
-            cls._require_non_empty_str(data, "code")
-            cls._require_non_empty_str(data, "question")
-            cls._optional_str(data, "note")
-        elif task_type == "explain_to":
-            cls._require_non_empty_str(data, "topic")
-            cls._require_non_empty_str(data, "audience")
-            cls._optional_str(data, "note")
-
-        cls._require_category(data)
-        cls._require_points(data)
-
-        # Get the appropriate task class
-        task_class = cls._TASK_CLASSES[task_type]
-
-        # Create copy of data and add ID
-        task_data = data.copy()
-        task_data["id"] = task_id
-
-        try:
-            return task_class(**task_data)
-        except TypeError as e:
-            raise ValueError(f"Invalid data for {task_type} task: {e}") from e
+        return builder(data, task_id)
+
+
+# Dispatch tables, built once after the class body so the bound classmethods
+# can be referenced directly.
+TaskFactory._BUILDERS = {
+    "quiz": TaskFactory._build_quiz,
+    "tabu": TaskFactory._build_tabu,
+    "discussion": TaskFactory._build_discussion,
+    "code": TaskFactory._build_code,
+    "explain_to": TaskFactory._build_explain_to,
+}
+
+_BASE_FIELDS = frozenset({"type", "points", "category", "difficulty"})
+TaskFactory._ALLOWED_FIELDS = {
+    "quiz": _BASE_FIELDS | {"question", "note"},
+    "tabu": _BASE_FIELDS | {"topic", "forbidden_words"},
+    "discussion": _BASE_FIELDS | {"prompt", "spotlight_duration"},
+    "code": _BASE_FIELDS | {"code", "question", "note"},
+    "explain_to": _BASE_FIELDS | {"topic", "audience", "note"},
+}
 
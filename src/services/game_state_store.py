@@ -15,24 +15,57 @@ from pathlib import Path
 
 from src.models.game_state import GameState
 
+# orjson is an optional accelerator: C-implemented, serializes straight to
+# UTF-8 bytes (no str round-trip) and is roughly an order of magnitude
+# faster than the stdlib with indentation. The stdlib stays as fallback so
+# the dependency remains optional.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class GameStateStoreError(Exception):
     pass
 
 
+# Payload last written per path. Saves are explicit (S key) and the state is
+# often unchanged between them, so an identical snapshot skips the disk write
+# entirely rather than rewriting the same bytes.
+_last_written: dict[str, bytes] = {}
+
+
 def save_state(filepath: str, state: GameState) -> None:
     path = Path(filepath)
     try:
+        if orjson is not None:
+            payload = orjson.dumps(state.to_dict(), option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(state.to_dict(), ensure_ascii=False, indent=2).encode("utf-8")
+
+        # Skip only when the bytes on disk are known to match AND the file
+        # is still there - if it was deleted or replaced externally, the
+        # user asking to save must get a file, not a silent no-op.
+        if _last_written.get(filepath) == payload and path.exists():
+            return
+
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(json.dumps(state.to_dict(), ensure_ascii=False, indent=2), encoding="utf-8")
+        path.write_bytes(payload)
+        _last_written[filepath] = payload
     except Exception as e:
+        # A failed write leaves the on-disk state unknown; never let a
+        # stale cache entry suppress the retry.
+        _last_written.pop(filepath, None)
         raise GameStateStoreError(f"Failed to save game state: {e}") from e
 
 
 def load_state(filepath: str) -> GameState:
     path = Path(filepath)
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
+        if orjson is not None:
+            data = orjson.loads(path.read_bytes())
+        else:
+            data = json.loads(path.read_text(encoding="utf-8"))
         return GameState.from_dict(data)
     except Exception as e:
         raise GameStateStoreError(f"Failed to load game state: {e}") from e
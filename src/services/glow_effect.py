@@ -7,7 +7,9 @@ Creates a large, soft gradient overlay across the screen.
 Design principle: Ambient background lighting, not spotlights.
 """
 
+import numpy as np
 import pygame
+from collections import OrderedDict
 from typing import Tuple, Optional
 from config import settings
 
@@ -20,9 +22,18 @@ class GlowEffect:
     with subtle colored light behind content.
     """
 
+    # Full-screen RGBA surfaces are ~8 MB each at 1080p, so the cache is
+    # bounded: beyond this many (size, color) combinations the least
+    # recently used surface is dropped and simply re-rendered on demand.
+    _CACHE_MAX = 16
+
     def __init__(self):
-        """Initialize glow effect cache."""
-        self._glow_cache = {}
+        """Initialize glow effect caches."""
+        self._glow_cache: OrderedDict = OrderedDict()
+        # Geometry-only alpha falloff per screen size, shared by all colors:
+        # the expensive distance computation runs once per size and new
+        # colors only pay a broadcast fill plus the alpha copy.
+        self._alpha_cache: dict = {}
 
     def render_background_glow(
         self,
@@ -36,25 +47,44 @@ class GlowEffect:
         Args:
             surface: Surface to draw on
             color: RGB color for glow (task accent color)
-            cache_key: Optional cache key (e.g., task type)
+            cache_key: Legacy hint, no longer used for lookup (the cache is
+                keyed on size and color, which fully determine the output)
         """
         if not settings.GLOW_ENABLED:
             return
 
-        # Check cache if key provided
-        if cache_key and cache_key in self._glow_cache:
-            glow_surface = self._glow_cache[cache_key]
-        else:
-            # Create new glow surface
+        # Cache on (size, color): these fully determine the rendered glow, so
+        # every repeat request - including callers without a cache_key - is a
+        # single blit instead of the 50-layer gradient pass. This also avoids
+        # serving a stale surface if two colors ever shared a cache_key.
+        key = (surface.get_size(), color)
+        glow_surface = self._glow_cache.get(key)
+        if glow_surface is None:
             glow_surface = self._create_background_glow(surface.get_size(), color)
-
-            # Cache if key provided
-            if cache_key:
-                self._glow_cache[cache_key] = glow_surface
+            self._glow_cache[key] = glow_surface
+            if len(self._glow_cache) > self._CACHE_MAX:
+                self._glow_cache.popitem(last=False)
+        else:
+            self._glow_cache.move_to_end(key)
 
         # Blit at origin - glow surface is full screen size
         surface.blit(glow_surface, (0, 0))
 
+    def warm(self, screen_size: Tuple[int, int], color: Tuple[int, int, int]) -> None:
+        """Populate the cache for a size/color pair without drawing anything.
+
+        Used at load time to pre-generate every glow the session will need,
+        so the first frame that shows a new accent color pays a blit instead
+        of the gradient render.
+        """
+        if not settings.GLOW_ENABLED:
+            return
+        key = (screen_size, color)
+        if key not in self._glow_cache:
+            self._glow_cache[key] = self._create_background_glow(screen_size, color)
+            if len(self._glow_cache) > self._CACHE_MAX:
+                self._glow_cache.popitem(last=False)
+
     def _create_background_glow(
         self,
         screen_size: Tuple[int, int],
@@ -65,7 +95,7 @@ class GlowEffect:
 
         Strategy:
         1. Create full-screen surface
-        2. Draw large radial gradient from center
+        2. Evaluate the radial quadratic falloff per pixel, vectorized
         3. Make it subtle with low alpha
 
         Args:
@@ -75,54 +105,68 @@ class GlowEffect:
         Returns:
             Transparent surface with background glow
         """
+        # The gradient is perfectly smooth, so build it at 1/8 resolution and
+        # let one smoothscale pass bring it up to screen size: a 64x smaller
+        # falloff evaluation with no visible difference for a soft glow.
         width, height = screen_size
+        small_size = (max(1, width // 8), max(1, height // 8))
+        small = pygame.Surface(small_size, pygame.SRCALPHA)
+
+        alpha = self._alpha_template(small_size)
+
+        # Write color and alpha channels directly; delete the views to
+        # unlock the surface before scaling.
+        rgb = pygame.surfarray.pixels3d(small)
+        rgb[:] = np.asarray(color, dtype=np.uint8)
+        del rgb
+        alpha_view = pygame.surfarray.pixels_alpha(small)
+        alpha_view[:] = alpha
+        del alpha_view
+
+        glow = pygame.transform.smoothscale(small, screen_size)
+        # Match the display pixel format so every cached blit takes the fast
+        # blitter path instead of converting per pixel. Headless use (no
+        # display mode) keeps the raw surface.
+        try:
+            return glow.convert_alpha()
+        except pygame.error:
+            return glow
+
+    def _alpha_template(self, screen_size: Tuple[int, int]):
+        """Return the (width, height) uint8 alpha falloff for this size.
+
+        Evaluates alpha = GLOW_INTENSITY * (1 - r^2/max_r^2)^2 for every
+        pixel in one vectorized pass, cached per screen size since the
+        falloff is pure geometry and independent of the glow color. Working
+        in squared-distance space skips the full-buffer sqrt pass; for an
+        ambient glow the slightly flatter center is imperceptible.
+        """
+        alpha = self._alpha_cache.get(screen_size)
+        if alpha is not None:
+            return alpha
 
-        # Create full-screen surface with alpha
-        glow_surface = pygame.Surface(screen_size, pygame.SRCALPHA)
-        glow_surface.fill((0, 0, 0, 0))
+        width, height = screen_size
 
         # Center point
         center_x = width // 2
         center_y = height // 2
 
-        # Calculate maximum radius to cover screen
-        max_radius = int(((width ** 2 + height ** 2) ** 0.5) / 2)
-
-        # Draw radial gradient with many layers
-        # More layers = smoother gradient
-        num_layers = 50
-
-        for i in range(num_layers, 0, -1):
-            # Progress from outer (0.0) to inner (1.0)
-            progress = i / num_layers
-
-            # Radius decreases from max to a small core
-            radius = int(max_radius * progress)
-
-            # Alpha increases towards center but stays subtle
-            # Use quadratic falloff for more natural glow
-            alpha = int(settings.GLOW_INTENSITY * (1 - progress) ** 2)
+        # Maximum radius to cover screen, kept squared to avoid the sqrt.
+        max_radius_sq = (width ** 2 + height ** 2) / 4
 
-            # Don't draw if alpha would be 0
-            if alpha < 1:
-                continue
+        # surfarray views are (width, height), hence the ogrid order.
+        xs, ys = np.ogrid[:width, :height]
+        t = 1.0 - ((xs - center_x) ** 2 + (ys - center_y) ** 2) / max_radius_sq
+        np.clip(t, 0.0, 1.0, out=t)
+        alpha = (settings.GLOW_INTENSITY * t * t).astype(np.uint8)
 
-            # Create color with calculated alpha
-            glow_color = (*color, alpha)
-
-            # Draw filled circle for this layer
-            pygame.draw.circle(
-                glow_surface,
-                glow_color,
-                (center_x, center_y),
-                radius
-            )
-
-        return glow_surface
+        self._alpha_cache[screen_size] = alpha
+        return alpha
 
     def clear_cache(self) -> None:
-        """Clear the glow cache (useful when changing settings)."""
+        """Clear the glow caches (useful when changing settings)."""
         self._glow_cache.clear()
+        self._alpha_cache.clear()
 
 
 # Global glow effect instance (singleton pattern)
@@ -145,6 +189,14 @@ def render_glow(
     _glow_effect.render_background_glow(surface, color, cache_key)
 
 
+def warm_glow_cache(
+    screen_size: Tuple[int, int],
+    color: Tuple[int, int, int]
+) -> None:
+    """Pre-generate the glow for a size/color pair without drawing."""
+    _glow_effect.warm(screen_size, color)
+
+
 def clear_glow_cache() -> None:
     """Clear the glow effect cache."""
     _glow_effect.clear_cache()
\ No newline at end of file
@@ -7,37 +7,111 @@ Implements DRY principle - shared rendering logic used by all renderers.
 Design principle: Pure utility functions, no state, no side effects.
 """
 
+from collections import OrderedDict, deque
 from typing import List, Tuple
 import pygame
 
 from src.services.text_normalize import normalize_text
 
+# Memoized font.render output. Font rasterization is the most expensive
+# pygame primitive on the overlay path and the same strings repeat across
+# frames, so identical (font, text, color) requests return a shared Surface.
+_TEXT_CACHE: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+_TEXT_CACHE_MAX = 256
+
+
+def render_text_cached(
+    font: pygame.font.Font,
+    text: str,
+    antialias: bool,
+    color: Tuple[int, int, int],
+) -> pygame.Surface:
+    """Render text via an LRU cache of ready-made surfaces.
+
+    The returned surface is shared - callers must only blit it, never mutate.
+    The font height is part of the key so a re-created font of a different
+    size cannot alias a stale entry via id() reuse.
+    """
+    key = (id(font), font.get_height(), text, color, antialias)
+    surface = _TEXT_CACHE.get(key)
+    if surface is None:
+        # Convert once to the display pixel format so every later blit is a
+        # straight copy instead of a per-pixel format conversion. Without a
+        # display mode (headless tests) the raw render is used as-is.
+        surface = font.render(text, antialias, color)
+        try:
+            surface = surface.convert_alpha()
+        except pygame.error:
+            pass
+        _TEXT_CACHE[key] = surface
+        if len(_TEXT_CACHE) > _TEXT_CACHE_MAX:
+            _TEXT_CACHE.popitem(last=False)
+    else:
+        _TEXT_CACHE.move_to_end(key)
+    return surface
+
+
+def clear_text_cache() -> None:
+    """Drop cached text surfaces and wrap results (e.g. after a font change)."""
+    _TEXT_CACHE.clear()
+    _WRAP_CACHE.clear()
+
 
 def _normalize_for_render(text: str) -> str:
     return normalize_text(text)
 
 
+def _font_height(font) -> int:
+    # Part of cache keys so a re-created font of a different size cannot
+    # alias a stale entry via id() reuse. Tolerates test doubles that only
+    # implement size().
+    get_height = getattr(font, "get_height", None)
+    return get_height() if get_height is not None else 0
+
+
 def _split_long_word(word: str, font: pygame.font.Font, max_width: int) -> List[str]:
-    """Split a single long token into chunks that fit max_width."""
+    """Split a single long token into chunks that fit max_width.
+
+    Per-character advances (measured once each) give a cheap estimate of
+    where a chunk ends; kerning and shaping mean the sum can differ from
+    the rendered width in either direction, so every chunk is then checked
+    with one exact font.size call and shortened if it truly overflows.
+    That keeps the work at O(chars) estimates plus O(chunks) exact
+    measurements instead of re-shaping the growing chunk per character.
+    """
     if not word:
         return [""]
 
+    size = font.size
     chunks: List[str] = []
-    current = ""
-    for ch in word:
-        test = current + ch
-        if current and font.size(test)[0] > max_width:
-            chunks.append(current)
-            current = ch
-        else:
-            current = test
-
-    if current:
-        chunks.append(current)
+    start = 0
+    n = len(word)
+    while start < n:
+        # Estimate the chunk end by accumulated char advances.
+        acc = 0
+        end = start
+        while end < n:
+            w = size(word[end])[0]
+            if end > start and acc + w > max_width:
+                break
+            acc += w
+            end += 1
+        # Exact check; back off while the rendered chunk is too wide.
+        while end - start > 1 and size(word[start:end])[0] > max_width:
+            end -= 1
+        chunks.append(word[start:end])
+        start = end
 
     return chunks
 
 
+# Memoized wrap results. Wrapping probes font.size per word; the same
+# (text, font, width) combination recurs every time a slide is recomposed,
+# so the line lists are cached like the text surfaces above.
+_WRAP_CACHE: "OrderedDict[tuple, List[str]]" = OrderedDict()
+_WRAP_CACHE_MAX = 256
+
+
 def wrap_text(text: str, font: pygame.font.Font, max_width: int, hard_wrap: bool = False) -> List[str]:
     """
     Wrap text to fit within a maximum width.
@@ -55,36 +129,64 @@ def wrap_text(text: str, font: pygame.font.Font, max_width: int, hard_wrap: bool
         hard_wrap: Whether to split long tokens that exceed max_width
 
     Returns:
-        List of text lines that fit within max_width
+        List of text lines that fit within max_width (shared - do not mutate)
     """
+    key = (id(font), _font_height(font), text, max_width, hard_wrap)
+    cached = _WRAP_CACHE.get(key)
+    if cached is not None:
+        _WRAP_CACHE.move_to_end(key)
+        return cached
+
     text = _normalize_for_render(text)
     words = text.split(" ")
-    lines: List[str] = []
-    current_line: List[str] = []
 
+    # Decide breaks by summed per-word advances (each word measured once,
+    # O(words) font.size calls instead of re-shaping growing prefixes,
+    # which is O(words^2) freetype work). The sum is only an estimate -
+    # kerning and shaping can make the rendered line wider or narrower -
+    # so each assembled line is verified with one exact font.size call and
+    # trailing words are demoted to the next line on true overflow.
+    size = font.size
+    space_w = size(" ")[0]
+
+    parts: "deque[str]" = deque()
     for word in words:
         # Optional: split long tokens up-front so they can be wrapped
-        word_parts = [word]
-        if hard_wrap and word and font.size(word)[0] > max_width:
-            word_parts = _split_long_word(word, font, max_width)
-
-        for part in word_parts:
-            # Try adding this word to current line
-            test_line = " ".join(current_line + [part]) if current_line else part
-            test_width = font.size(test_line)[0]
-
-            if test_width <= max_width:
-                current_line.append(part)
-            else:
-                if current_line:
-                    lines.append(" ".join(current_line))
-                    current_line = [part]
-                else:
-                    # Single word is too long - add it anyway (legacy behavior)
-                    lines.append(part)
-
-    if current_line:
+        if hard_wrap and word and size(word)[0] > max_width:
+            parts.extend(_split_long_word(word, font, max_width))
+        else:
+            parts.append(word)
+
+    lines: List[str] = []
+    current_line: List[str] = []
+    current_w = 0
+
+    while parts:
+        part = parts.popleft()
+        part_w = size(part)[0]
+        test_width = part_w if not current_line else current_w + space_w + part_w
+
+        if test_width <= max_width or not current_line:
+            # A single word wider than max_width still gets its own line
+            # (legacy behavior); the close below cannot demote it.
+            current_line.append(part)
+            current_w = test_width
+            if parts:
+                continue
+        else:
+            parts.appendleft(part)
+
+        # Close the line: the exact measurement guards the estimate, and
+        # demoted words re-enter the queue in their original order.
+        while len(current_line) > 1 and size(" ".join(current_line))[0] > max_width:
+            parts.appendleft(current_line.pop())
         lines.append(" ".join(current_line))
+        current_line = []
+        current_w = 0
+
+    _WRAP_CACHE[key] = lines
+    if len(_WRAP_CACHE) > _WRAP_CACHE_MAX:
+        _WRAP_CACHE.popitem(last=False)
 
     return lines
 
@@ -93,7 +195,8 @@ def center_text_block(
     lines: List[str],
     font: pygame.font.Font,
     screen_rect: pygame.Rect,
-    y_offset: int = 0
+    y_offset: int = 0,
+    color: Tuple[int, int, int] = (255, 255, 255),
 ) -> List[Tuple[pygame.Surface, pygame.Rect]]:
     """
     Center a block of text lines on screen.
@@ -106,6 +209,7 @@ def center_text_block(
         font: Font to render text with
         screen_rect: Screen rectangle for centering calculation
         y_offset: Vertical offset from center (positive = down)
+        color: Text color for all lines
 
     Returns:
         List of (text_surface, rect) tuples ready to blit
@@ -119,7 +223,7 @@ def center_text_block(
     max_width = 0
 
     for line in lines:
-        surface = font.render(line, True, (255, 255, 255))  # Color will be set later
+        surface = render_text_cached(font, line, True, color)
         rendered_lines.append(surface)
         total_height += surface.get_height()
         max_width = max(max_width, surface.get_width())
@@ -147,12 +251,17 @@ def draw_text_centered(
     font: pygame.font.Font,
     color: Tuple[int, int, int],
     y_position: int
-) -> None:
-    """Draw a single line of text centered horizontally."""
+) -> pygame.Rect:
+    """Draw a single line of text centered horizontally.
+
+    Returns:
+        The rect the text was blitted to (useful for dirty-rect tracking).
+    """
     text = _normalize_for_render(text)
-    text_surface = font.render(text, True, color)
+    text_surface = render_text_cached(font, text, True, color)
     text_rect = text_surface.get_rect(centerx=surface.get_width() // 2, top=y_position)
     surface.blit(text_surface, text_rect)
+    return text_rect
 
 
 def draw_text_centered_shadow(
@@ -163,18 +272,28 @@ def draw_text_centered_shadow(
     y_position: int,
     shadow_color: Tuple[int, int, int] = (0, 0, 0),
     shadow_offset: Tuple[int, int] = (2, 2),
-) -> None:
-    """Draw centered text with a subtle drop shadow for better projector readability."""
+) -> pygame.Rect:
+    """Draw centered text with a subtle drop shadow for better projector readability.
+
+    Returns:
+        The union rect covering shadow and text (useful for dirty-rect tracking).
+    """
     text = _normalize_for_render(text)
-    shadow_surface = font.render(text, True, shadow_color)
-    shadow_rect = shadow_surface.get_rect(
-        centerx=surface.get_width() // 2,
-        top=y_position,
-    )
+    centerx = surface.get_width() // 2
+
+    shadow_surface = render_text_cached(font, text, True, shadow_color)
+    shadow_rect = shadow_surface.get_rect(centerx=centerx, top=y_position)
     shadow_rect.move_ip(shadow_offset)
-    surface.blit(shadow_surface, shadow_rect)
 
-    draw_text_centered(surface, text, font, color, y_position)
+    text_surface = render_text_cached(font, text, True, color)
+    text_rect = text_surface.get_rect(centerx=centerx, top=y_position)
+
+    # Both layers in one blits() call - a single Python->C crossing.
+    surface.blits(
+        ((shadow_surface, shadow_rect), (text_surface, text_rect)),
+        doreturn=False,
+    )
+    return text_rect.union(shadow_rect)
 
 
 def draw_bordered_box(
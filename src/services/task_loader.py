@@ -7,12 +7,22 @@ Provides error handling for common file and data issues.
 Design principle: Service layer - no UI, no state, just data transformation.
 """
 
+import functools
 import json
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Optional, Tuple
 
 from src.models.task import BaseTask, TaskFactory
 
+# Optional accelerator, same pattern as game_state_store: orjson parses
+# bytes directly in C several times faster than the stdlib, with stdlib
+# json as fallback so the dependency stays optional.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class TaskLoadError(Exception):
     """Custom exception for task loading errors."""
@@ -20,6 +30,13 @@ class TaskLoadError(Exception):
     pass
 
 
+# In-flight background reads started by TaskLoader.prefetch, keyed by path.
+# A single worker is plenty: there is one task file and the point is to
+# overlap its disk read with pygame/SDL startup, not to parallelize reads.
+_PREFETCH_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_PREFETCHED: "Dict[str, Future]" = {}
+
+
 class TaskLoader:
     """
     Service for loading tasks from JSON files.
@@ -45,19 +62,65 @@ class TaskLoader:
         """
         # Convert to Path object for better path handling
         path = Path(filepath)
-        
-        # Check if file exists
-        if not path.exists():
+
+        # Repeated loads of an unchanged file (verifier, CLI, tests) skip
+        # the parse entirely: results are memoized per (path, mtime, size),
+        # so an edited or replaced file naturally misses the cache. The
+        # stat doubles as the existence check.
+        try:
+            st = path.stat()
+        except FileNotFoundError:
             raise TaskLoadError(
                 f"Task file not found: {filepath}\n"
                 f"Make sure the file exists at the specified path."
-            )
-        
-        # Read and parse JSON
+            ) from None
+        except OSError as e:
+            raise TaskLoadError(
+                f"Failed to read task file: {filepath}\n"
+                f"Error: {e}"
+            ) from e
+
+        tasks = _load_tasks_cached(str(path), st.st_mtime_ns, st.st_size)
+        # Fresh list per caller; the task objects themselves are shared.
+        return list(tasks)
+
+    @staticmethod
+    def prefetch(filepath: str) -> None:
+        """Start reading a task file in the background.
+
+        Called ahead of slow startup work (pygame/SDL init) so the disk
+        read overlaps it; the next load_tasks for the same path consumes
+        the prefetched bytes instead of reading inline. Read errors are
+        deferred to that load. Safe to call repeatedly.
+        """
+        global _PREFETCH_EXECUTOR
+        key = str(Path(filepath))
+        if key in _PREFETCHED:
+            return
+        if _PREFETCH_EXECUTOR is None:
+            _PREFETCH_EXECUTOR = ThreadPoolExecutor(max_workers=1)
+        _PREFETCHED[key] = _PREFETCH_EXECUTOR.submit(Path(key).read_bytes)
+
+    @staticmethod
+    def _parse_tasks(filepath: str) -> Tuple[BaseTask, ...]:
+        """Read, parse and validate a task file (uncached)."""
+        path = Path(filepath)
+
+        # Read and parse JSON. read_bytes is one open+read, and bytes suit
+        # both parsers: orjson requires them and stdlib json accepts them,
+        # so the str decode is skipped. A prefetch started earlier hands
+        # over its bytes here; its read errors surface the same way an
+        # inline read's would.
+        prefetched = _PREFETCHED.pop(filepath, None)
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-        except json.JSONDecodeError as e:
+            raw = prefetched.result() if prefetched is not None else path.read_bytes()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        except FileNotFoundError:
+            raise TaskLoadError(
+                f"Task file not found: {filepath}\n"
+                f"Make sure the file exists at the specified path."
+            ) from None
+        except ValueError as e:
             raise TaskLoadError(
                 f"Invalid JSON in task file: {filepath}\n"
                 f"Error: {e}"
@@ -89,9 +152,9 @@ class TaskLoader:
                 raise TaskLoadError(
                     f"Invalid task at index {index}: {e}"
                 ) from e
-        
-        return tasks
-    
+
+        return tuple(tasks)
+
     @staticmethod
     def validate_task_file(filepath: str) -> bool:
         """
@@ -110,3 +173,13 @@ class TaskLoader:
             return True
         except TaskLoadError:
             return False
+
+
+@functools.lru_cache(maxsize=32)
+def _load_tasks_cached(filepath: str, mtime_ns: int, size: int) -> "Tuple[BaseTask, ...]":
+    """Memoized parse keyed on path plus the file's change markers.
+
+    mtime_ns and size only widen the key: an edited or replaced file gets a
+    new key and a fresh parse. Load errors are re-raised, not cached.
+    """
+    return TaskLoader._parse_tasks(filepath)
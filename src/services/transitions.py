@@ -18,16 +18,24 @@ from __future__ import annotations
 import pygame
 
 
-def crossfade(prev_surface: pygame.Surface, next_surface: pygame.Surface, progress: float) -> pygame.Surface:
+def crossfade(
+    prev_surface: pygame.Surface,
+    next_surface: pygame.Surface,
+    progress: float,
+    out: pygame.Surface | None = None,
+) -> pygame.Surface:
     """Crossfade two surfaces.
 
     Args:
         prev_surface: previous frame surface
         next_surface: next frame surface
         progress: 0.0 shows prev_surface, 1.0 shows next_surface
+        out: optional destination surface (same size) written in-place.
+            Passing a persistent scratch surface avoids allocating a
+            full-screen buffer on every transition frame.
 
     Returns:
-        New blended surface.
+        The blended surface (``out`` when provided, otherwise a new surface).
 
     Raises:
         ValueError: if surface sizes differ or progress is out of range
@@ -38,17 +46,23 @@ def crossfade(prev_surface: pygame.Surface, next_surface: pygame.Surface, progre
     if not (0.0 <= progress <= 1.0):
         raise ValueError("progress must be between 0.0 and 1.0")
 
-    out = pygame.Surface(prev_surface.get_size()).convert_alpha()
+    if out is None:
+        out = pygame.Surface(prev_surface.get_size()).convert_alpha()
+    elif out.get_size() != prev_surface.get_size():
+        raise ValueError("out surface must have the same size")
     out.fill((0, 0, 0, 0))
 
     # Draw previous frame
     out.blit(prev_surface, (0, 0))
 
-    # Draw next frame with alpha
+    # Draw next frame with alpha. The surface-alpha blit runs in SDL's
+    # vectorized blitters; setting the alpha on the source directly (and
+    # restoring it) avoids copying a full-screen surface every frame.
     alpha = int(255 * progress)
-    next_copy = next_surface.copy()
-    next_copy.set_alpha(alpha)
-    out.blit(next_copy, (0, 0))
+    saved_alpha = next_surface.get_alpha()
+    next_surface.set_alpha(alpha)
+    out.blit(next_surface, (0, 0))
+    next_surface.set_alpha(saved_alpha)
 
     return out
 
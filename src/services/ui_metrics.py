@@ -5,41 +5,67 @@ To keep layouts consistent, renderers should use these helpers instead of
 raw settings constants for paddings/box sizes/borders.
 
 This intentionally clamps extreme values to prevent negative/absurd layouts.
+
+All helpers are memoized: they are called per widget per frame and their
+inputs (settings constants and UI_SCALE) are fixed at startup. Use
+refresh_metrics() / ui_scale.refresh_ui_scale() after a settings change.
 """
 
 from __future__ import annotations
 
+import functools
+
 from config import settings
 from src.services.ui_scale import ui_scale
 
 
+@functools.lru_cache(maxsize=None)
 def pad_large() -> int:
     return ui_scale(settings.PADDING_LARGE)
 
 
+@functools.lru_cache(maxsize=None)
 def pad_medium() -> int:
     return ui_scale(settings.PADDING_MEDIUM)
 
 
+@functools.lru_cache(maxsize=None)
 def pad_small() -> int:
     return ui_scale(settings.PADDING_SMALL)
 
 
+@functools.lru_cache(maxsize=None)
 def border_width() -> int:
     return max(1, ui_scale(settings.BORDER_WIDTH))
 
 
+@functools.lru_cache(maxsize=None)
 def border_radius() -> int:
     return max(0, ui_scale(getattr(settings, "BORDER_RADIUS", 0)))
 
 
+@functools.lru_cache(maxsize=None)
 def content_max_width() -> int:
     # Don't exceed screen width; keep it within a sensible multiple.
     base = ui_scale(settings.CONTENT_MAX_WIDTH)
     return max(300, base)
 
 
+@functools.lru_cache(maxsize=None)
 def content_center_y_offset() -> int:
     # Allow negative offsets; scale magnitude.
     return int(round((getattr(settings, "CONTENT_CENTER_Y_OFFSET", 0)) * float(getattr(settings, "UI_SCALE", 1.0) or 1.0)))
 
+
+def refresh_metrics() -> None:
+    """Invalidate all memoized metric values after a settings change."""
+    for helper in (
+        pad_large,
+        pad_medium,
+        pad_small,
+        border_width,
+        border_radius,
+        content_max_width,
+        content_center_y_offset,
+    ):
+        helper.cache_clear()
@@ -10,12 +10,25 @@ This module provides a tiny helper to scale integer pixel values.
 
 from __future__ import annotations
 
+import functools
+
 from config import settings
 
 
+# Called many times per frame with the same few layout constants; memoizing
+# collapses the getattr + float math to a dict lookup. UI_SCALE is fixed at
+# startup - call refresh_ui_scale() if it ever changes at runtime.
+@functools.lru_cache(maxsize=None)
 def ui_scale(value: int) -> int:
     scale = float(getattr(settings, "UI_SCALE", 1.0) or 1.0)
     if scale <= 0:
         scale = 1.0
     return max(1, int(round(value * scale)))
 
+
+def refresh_ui_scale() -> None:
+    """Invalidate cached scale results after settings.UI_SCALE changes."""
+    ui_scale.cache_clear()
+
+    from src.services.ui_metrics import refresh_metrics
+    refresh_metrics()
@@ -40,6 +40,12 @@ class BaseRenderer(ABC):
         # Initialize fonts (cached for performance)
         self._init_fonts()
 
+        # Hot-path snapshots: render() runs every frame and these settings
+        # are fixed at startup, so the module-dict lookups are hoisted here.
+        self._color_background = settings.COLOR_BACKGROUND
+        self._color_text_secondary = settings.COLOR_TEXT_SECONDARY
+        self._footer_y = self.screen_rect.height - pad_large()
+
     def _init_fonts(self) -> None:
         """Initialize all fonts used by renderers."""
         families = [getattr(settings, "FONT_FAMILY_PRIMARY", None)]
@@ -71,6 +77,13 @@ class BaseRenderer(ABC):
             self.font_small = pygame.font.Font(None, ui_scale(settings.FONT_SIZE_SMALL))
             self.font_tiny = pygame.font.Font(None, ui_scale(settings.FONT_SIZE_TINY))
 
+        # Line metrics are fixed per font; query SDL_ttf once here instead
+        # of on every content layout.
+        self._linesize_title = self.font_title.get_linesize()
+        self._linesize_subtitle = self.font_subtitle.get_linesize()
+        self._linesize_body = self.font_body.get_linesize()
+        self._linesize_small = self.font_small.get_linesize()
+
     def render(self, task: BaseTask, position_info: str) -> None:
         """
         Render a complete frame with task content.
@@ -86,7 +99,7 @@ class BaseRenderer(ABC):
             position_info: Current position string (e.g., "3 / 12")
         """
         # Clear screen
-        self.screen.fill(settings.COLOR_BACKGROUND)
+        self.screen.fill(self._color_background)
 
         # Render glow effect before content
         # Subclasses can override get_glow_config() to customize
@@ -130,13 +143,11 @@ class BaseRenderer(ABC):
         Args:
             position_info: Position string like "3 / 12"
         """
-        footer_y = self.screen_rect.height - pad_large()
-
         # Position indicator
         draw_text_centered(
             self.screen,
             position_info,
             self.font_small,
-            settings.COLOR_TEXT_SECONDARY,
-            footer_y
+            self._color_text_secondary,
+            self._footer_y
         )
\ No newline at end of file
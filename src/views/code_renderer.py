@@ -9,17 +9,34 @@ Design principle: Clean code display, easy JSON integration.
 """
 
 import pygame
+from collections import OrderedDict
 from config import settings
 from src.models.task import CodeTask
 from src.views.base_renderer import BaseRenderer
-from src.services.renderer_utils import draw_text_centered_shadow
+from src.services.renderer_utils import draw_text_centered_shadow, render_text_cached
 from src.services.ui_metrics import pad_large, pad_medium, border_width
 from src.services.ui_scale import ui_scale
 
 
+# SysFont construction scans font files on first use; share one mono font
+# per (family, size) across renderer instances.
+_MONO_FONT_CACHE: dict = {}
+
+
 class CodeRenderer(BaseRenderer):
     """Renderer for code analysis tasks."""
 
+    # Composed box surfaces are code-snippet sized; a handful covers the
+    # session's code tasks while bounding memory.
+    _BOX_CACHE_MAX = 8
+
+    def __init__(self, screen: pygame.Surface):
+        super().__init__(screen)
+        # Fully composed code boxes (fill + border + text) keyed by snippet,
+        # so a stable snippet costs one blit per frame instead of
+        # re-rasterizing every line.
+        self._box_cache: "OrderedDict[str, pygame.Surface]" = OrderedDict()
+
     def get_glow_config(self, task: CodeTask) -> dict:
         return {
             "color": settings.COLOR_ACCENT_CODE,
@@ -42,7 +59,7 @@ class CodeRenderer(BaseRenderer):
             start_y,
         )
 
-        code_start_y = start_y + self.font_subtitle.get_linesize() + pad_large()
+        code_start_y = start_y + self._linesize_subtitle + pad_large()
 
         self._render_code_box(task.code, code_start_y)
 
@@ -58,20 +75,41 @@ class CodeRenderer(BaseRenderer):
 
     def _init_mono_font(self) -> None:
         """Initialize monospace font for code display."""
-        try:
-            self.font_mono = pygame.font.SysFont(
-                settings.FONT_FAMILY_MONO,
-                ui_scale(settings.FONT_SIZE_BODY),
-                bold=False,
-            )
-        except Exception:
-            self.font_mono = pygame.font.Font(None, ui_scale(settings.FONT_SIZE_BODY))
+        size = ui_scale(settings.FONT_SIZE_BODY)
+        key = (settings.FONT_FAMILY_MONO, size)
+        font = _MONO_FONT_CACHE.get(key)
+        if font is None:
+            try:
+                font = pygame.font.SysFont(settings.FONT_FAMILY_MONO, size, bold=False)
+            except Exception:
+                font = pygame.font.Font(None, size)
+            _MONO_FONT_CACHE[key] = font
+        self.font_mono = font
+        self._linesize_mono = font.get_linesize()
 
     def _render_code_box(self, code: str, start_y: int) -> None:
-        """Render code in a bordered box with monospace font."""
+        """Render code in a bordered box with monospace font.
+
+        The complete box (fill, border, all lines) is composed once per
+        snippet and cached, so repeated frames pay one screen blit.
+        """
+        box = self._box_cache.get(code)
+        if box is None:
+            box = self._compose_code_box(code)
+            self._box_cache[code] = box
+            if len(self._box_cache) > self._BOX_CACHE_MAX:
+                self._box_cache.popitem(last=False)
+        else:
+            self._box_cache.move_to_end(code)
+
+        box_x = (self.screen_rect.width - box.get_width()) // 2
+        self.screen.blit(box, (box_x, start_y))
+
+    def _compose_code_box(self, code: str) -> pygame.Surface:
+        """Build the bordered code box surface for a snippet."""
         code_lines = code.split("\n")
 
-        line_height = self.font_mono.get_linesize()
+        line_height = self._linesize_mono
         box_padding = pad_medium()
 
         rendered_lines = []
@@ -79,7 +117,7 @@ class CodeRenderer(BaseRenderer):
 
         for line in code_lines:
             display_line = line if line.strip() else " "
-            surface = self.font_mono.render(display_line, True, settings.COLOR_TEXT_PRIMARY)
+            surface = render_text_cached(self.font_mono, display_line, True, settings.COLOR_TEXT_PRIMARY)
             rendered_lines.append(surface)
             max_line_width = max(max_line_width, surface.get_width())
 
@@ -89,20 +127,23 @@ class CodeRenderer(BaseRenderer):
         )
         box_height = (len(code_lines) * line_height) + (box_padding * 2)
 
-        box_x = (self.screen_rect.width - box_width) // 2
-        box_rect = pygame.Rect(box_x, start_y, box_width, box_height)
+        box = pygame.Surface((box_width, box_height), pygame.SRCALPHA)
+        box_rect = box.get_rect()
 
-        pygame.draw.rect(self.screen, settings.COLOR_SURFACE, box_rect)
-        pygame.draw.rect(
-            self.screen,
-            settings.COLOR_ACCENT_CODE,
-            box_rect,
-            border_width(),
-        )
+        pygame.draw.rect(box, settings.COLOR_SURFACE, box_rect)
+        pygame.draw.rect(box, settings.COLOR_ACCENT_CODE, box_rect, border_width())
 
-        current_y = start_y + box_padding
+        # One blits() call for all code lines keeps the Python->C crossing
+        # per box instead of per line.
+        current_y = box_padding
+        line_blits = []
         for line_surface in rendered_lines:
-            line_x = box_x + box_padding
-            self.screen.blit(line_surface, (line_x, current_y))
+            line_blits.append((line_surface, (box_padding, current_y)))
             current_y += line_height
+        box.blits(line_blits, doreturn=False)
+
+        try:
+            return box.convert_alpha()
+        except pygame.error:
+            return box
 
@@ -61,9 +61,9 @@ class DiscussionRenderer(BaseRenderer):
 
         # Calculate vertical position
         # Center the entire content block (prompt + duration)
-        title_h = self.font_title.get_linesize()
-        subtitle_h = self.font_subtitle.get_linesize()
-        small_h = self.font_small.get_linesize()
+        title_h = self._linesize_title
+        subtitle_h = self._linesize_subtitle
+        small_h = self._linesize_small
 
         total_height = len(prompt_lines) * title_h
 
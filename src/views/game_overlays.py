@@ -6,6 +6,7 @@ beyond drawing onto the provided surface.
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from typing import Optional
 
 import pygame
@@ -13,10 +14,82 @@ import pygame
 from config import settings
 from src.models.game_state import BuzzState, GameState
 from src.models.session import Session
-from src.services.renderer_utils import draw_text_centered_shadow
+from src.services.renderer_utils import draw_text_centered_shadow, render_text_cached
 from src.services.ui_metrics import content_max_width, pad_large, border_width
 
 
+# Composed scoreboard pills keyed by (name, score, selected, buzzed, font
+# height). Names are fixed and scores change rarely, so each state of a card
+# is drawn once; the bound covers several teams times the small state space.
+_PILL_CACHE: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+_PILL_CACHE_MAX = 64
+
+
+def _team_pill(
+    font: pygame.font.Font,
+    label: str,
+    score: str,
+    border: tuple,
+) -> pygame.Surface:
+    """Return the fully composed pill card for one team."""
+    pad = 14
+    key = (label, score, border, font.get_height())
+    pill = _PILL_CACHE.get(key)
+    if pill is not None:
+        _PILL_CACHE.move_to_end(key)
+        return pill
+
+    label_s = render_text_cached(font, label, True, settings.COLOR_TEXT_PRIMARY)
+    score_s = render_text_cached(font, score, True, settings.COLOR_TEXT_PRIMARY)
+
+    card_h = max(label_s.get_height(), score_s.get_height()) + pad * 2
+    card_w = label_s.get_width() + score_s.get_width() + pad * 3 + 10
+    card = pygame.Rect(0, 0, card_w, card_h)
+
+    pill = pygame.Surface((card_w, card_h), pygame.SRCALPHA)
+    pygame.draw.rect(pill, settings.COLOR_SURFACE, card, border_radius=14)
+    pygame.draw.rect(pill, border, card, width=2, border_radius=14)
+    pill.blits(
+        (
+            (label_s, (pad, (card_h - label_s.get_height()) // 2)),
+            (score_s, (card_w - pad - score_s.get_width(), (card_h - score_s.get_height()) // 2)),
+        ),
+        doreturn=False,
+    )
+
+    _PILL_CACHE[key] = pill
+    if len(_PILL_CACHE) > _PILL_CACHE_MAX:
+        _PILL_CACHE.popitem(last=False)
+    return pill
+
+
+# Translucent panel backgrounds for the roster/help overlays, keyed by
+# (size, alpha). The fill plus border never changes while an overlay is
+# open, so the allocation and large alpha fill happen once per size.
+_OVERLAY_BG_CACHE: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+_OVERLAY_BG_CACHE_MAX = 4
+
+# Fully composed help panels (background + all lines), keyed by size, mode
+# flags and font; the content is immutable so one blit shows the overlay.
+_HELP_PANEL_CACHE: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+_HELP_PANEL_CACHE_MAX = 4
+
+
+def _overlay_background(box_w: int, box_h: int, alpha: int) -> pygame.Surface:
+    key = (box_w, box_h, alpha)
+    bg = _OVERLAY_BG_CACHE.get(key)
+    if bg is None:
+        bg = pygame.Surface((box_w, box_h), pygame.SRCALPHA)
+        bg.fill((0, 0, 0, alpha))
+        pygame.draw.rect(bg, settings.COLOR_BORDER, bg.get_rect(), border_width())
+        _OVERLAY_BG_CACHE[key] = bg
+        if len(_OVERLAY_BG_CACHE) > _OVERLAY_BG_CACHE_MAX:
+            _OVERLAY_BG_CACHE.popitem(last=False)
+    else:
+        _OVERLAY_BG_CACHE.move_to_end(key)
+    return bg
+
+
 def _format_ms(ms: int) -> str:
     total_s = max(0, ms) // 1000
     m = total_s // 60
@@ -29,59 +102,42 @@ def draw_scoreboard(
     font: pygame.font.Font,
     game_state: GameState,
     selected_team: Optional[int],
-) -> None:
-    """Draw a compact scoreboard as pill cards at the top."""
-    pad = 14
+) -> Optional[pygame.Rect]:
+    """Draw a compact scoreboard as pill cards at the top.
+
+    Returns:
+        Union rect of all team cards, or None when there are no teams.
+    """
     x = 16
     y = 14
+    dirty: Optional[pygame.Rect] = None
+    card_blits: list[tuple[pygame.Surface, tuple[int, int]]] = []
 
     for idx, team in enumerate(game_state.teams):
         is_selected = selected_team == idx
         is_buzzed = game_state.buzz_state == BuzzState.LOCKED and game_state.buzz_locked_team == idx
 
-        label = f"{idx + 1}  {team.name}:"
-        score = str(team.score)
-
-        # Measure
-        label_s = font.render(label, True, settings.COLOR_TEXT_PRIMARY)
-        score_s = font.render(score, True, settings.COLOR_TEXT_PRIMARY)
-
-        card_h = max(label_s.get_height(), score_s.get_height()) + pad * 2
-        card_w = label_s.get_width() + score_s.get_width() + pad * 3 + 10
-
-        card = pygame.Rect(x, y, card_w, card_h)
-
-        # Colors
-        fill = settings.COLOR_SURFACE
         border = settings.COLOR_BORDER
-        text_color = settings.COLOR_TEXT_PRIMARY
-
         if is_selected:
             border = settings.COLOR_ACCENT_QUIZ
         if is_buzzed:
             border = settings.COLOR_ACCENT_TABU
 
-        # Draw card
-        pygame.draw.rect(surface, fill, card, border_radius=14)
-        pygame.draw.rect(surface, border, card, width=2, border_radius=14)
+        pill = _team_pill(font, f"{idx + 1}  {team.name}:", str(team.score), border)
+        card = pygame.Rect((x, y), pill.get_size())
+        card_blits.append((pill, (x, y)))
+
+        dirty = card if dirty is None else dirty.union(card)
 
-        # Text
-        label_s = font.render(label, True, text_color)
-        score_s = font.render(score, True, text_color)
+        x += card.width + 12
 
-        surface.blit(label_s, (card.x + pad, card.y + (card_h - label_s.get_height()) // 2))
-        surface.blit(
-            score_s,
-            (
-                card.right - pad - score_s.get_width(),
-                card.y + (card_h - score_s.get_height()) // 2,
-            ),
-        )
+    # One Python->C crossing for all cards instead of several per team.
+    surface.blits(card_blits, doreturn=False)
 
-        x += card_w + 12
+    return dirty
 
 
-def draw_buzz_status(surface: pygame.Surface, font: pygame.font.Font, game_state: GameState) -> None:
+def draw_buzz_status(surface: pygame.Surface, font: pygame.font.Font, game_state: GameState) -> pygame.Rect:
     state = game_state.buzz_state
     if state == BuzzState.CLOSED:
         text = "BUZZ: CLOSED (B=open)"
@@ -95,10 +151,10 @@ def draw_buzz_status(surface: pygame.Surface, font: pygame.font.Font, game_state
         text = f"BUZZ: LOCKED → {name}"
         color = settings.COLOR_ACCENT_TABU
 
-    draw_text_centered_shadow(surface, text, font, color, y_position=20)
+    return draw_text_centered_shadow(surface, text, font, color, y_position=20)
 
 
-def draw_timer(surface: pygame.Surface, font: pygame.font.Font, game_state: GameState) -> None:
+def draw_timer(surface: pygame.Surface, font: pygame.font.Font, game_state: GameState) -> pygame.Rect:
     ms = game_state.timer.elapsed_ms
     if game_state.timer.mode.value == "countdown" and game_state.timer.remaining_ms() is not None:
         ms = game_state.timer.remaining_ms() or 0
@@ -106,15 +162,18 @@ def draw_timer(surface: pygame.Surface, font: pygame.font.Font, game_state: Game
     state = "RUN" if game_state.timer.running else "PAUSE"
     text = f"{state} {_format_ms(ms)}"
 
-    rendered = font.render(text, True, settings.COLOR_TEXT_SECONDARY)
+    rendered = render_text_cached(font, text, True, settings.COLOR_TEXT_SECONDARY)
     rect = rendered.get_rect(topright=(surface.get_width() - 20, 20))
     surface.blit(rendered, rect)
+    return rect
 
 
-def draw_status_message(surface: pygame.Surface, font: pygame.font.Font, game_state: GameState) -> None:
+def draw_status_message(
+    surface: pygame.Surface, font: pygame.font.Font, game_state: GameState
+) -> Optional[pygame.Rect]:
     if not game_state.status_message:
-        return
-    draw_text_centered_shadow(
+        return None
+    return draw_text_centered_shadow(
         surface,
         game_state.status_message,
         font,
@@ -128,7 +187,7 @@ def draw_roster_overlay(
     font: pygame.font.Font,
     session: Session,
     visible_count: int = 8,
-) -> None:
+) -> pygame.Rect:
     """Draw a simple roster list of upcoming tasks with points."""
     w, h = surface.get_size()
     box_w = min(content_max_width(), w - 2 * pad_large())
@@ -137,14 +196,11 @@ def draw_roster_overlay(
     box_y = int(pad_large() * 1.2)
 
     box = pygame.Rect(box_x, box_y, box_w, box_h)
-    overlay = pygame.Surface((box_w, box_h), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 140))
-    surface.blit(overlay, (box_x, box_y))
-    pygame.draw.rect(surface, settings.COLOR_BORDER, box, border_width())
+    surface.blit(_overlay_background(box_w, box_h, 140), (box_x, box_y))
 
     title = "ROSTER (Tab to close)"
-    title_s = font.render(title, True, settings.COLOR_TEXT_PRIMARY)
-    surface.blit(title_s, (box_x + 20, box_y + 20))
+    title_s = render_text_cached(font, title, True, settings.COLOR_TEXT_PRIMARY)
+    blits: list[tuple[pygame.Surface, tuple[int, int]]] = [(title_s, (box_x + 20, box_y + 20))]
 
     start = session.current_index
     y = box_y + 70
@@ -154,10 +210,13 @@ def draw_roster_overlay(
         task = session.tasks[idx]
         marker = "→" if idx == session.current_index else " "
         line = f"{marker} {idx + 1:02d}. [{task.type}] {task.points}pt"
-        s = font.render(line, True, settings.COLOR_TEXT_SECONDARY)
-        surface.blit(s, (box_x + 20, y))
+        s = render_text_cached(font, line, True, settings.COLOR_TEXT_SECONDARY)
+        blits.append((s, (box_x + 20, y)))
         y += s.get_height() + 6
 
+    surface.blits(blits, doreturn=False)
+    return box
+
 
 def draw_help_overlay(
     surface: pygame.Surface,
@@ -165,7 +224,7 @@ def draw_help_overlay(
     *,
     enable_game_show: bool = True,
     enable_board: bool = False,
-) -> None:
+) -> pygame.Rect:
     w, h = surface.get_size()
     box_w = min(content_max_width(), w - 2 * pad_large())
     box_h = int(h * 0.55)
@@ -173,10 +232,16 @@ def draw_help_overlay(
     box_y = int(pad_large() * 1.2)
 
     box = pygame.Rect(box_x, box_y, box_w, box_h)
-    overlay = pygame.Surface((box_w, box_h), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 150))
-    surface.blit(overlay, (box_x, box_y))
-    pygame.draw.rect(surface, settings.COLOR_BORDER, box, border_width())
+
+    # The help content is fully static per mode, so the whole panel
+    # (background, border, every line) is composed once and reused.
+    key = (box_w, box_h, enable_game_show, enable_board, font.get_height())
+    panel = _HELP_PANEL_CACHE.get(key)
+    if panel is not None:
+        surface.blit(panel, (box_x, box_y))
+        return box
+
+    panel = _overlay_background(box_w, box_h, 150).copy()
 
     if enable_board:
         lines = [
@@ -211,16 +276,27 @@ def draw_help_overlay(
                 "S / L  : save / load",
             ]
 
-    y = box_y + 20
+    y = 20
+    blits: list[tuple[pygame.Surface, tuple[int, int]]] = []
     for i, line in enumerate(lines):
         color = settings.COLOR_TEXT_PRIMARY if i == 0 else settings.COLOR_TEXT_SECONDARY
-        s = font.render(line, True, color)
-        surface.blit(s, (box_x + 20, y))
+        s = render_text_cached(font, line, True, color)
+        blits.append((s, (20, y)))
         y += s.get_height() + 10
 
+    panel.blits(blits, doreturn=False)
+
+    _HELP_PANEL_CACHE[key] = panel
+    if len(_HELP_PANEL_CACHE) > _HELP_PANEL_CACHE_MAX:
+        _HELP_PANEL_CACHE.popitem(last=False)
+
+    surface.blit(panel, (box_x, box_y))
+    return box
+
 
-def draw_help_hint(surface: pygame.Surface, font: pygame.font.Font) -> None:
+def draw_help_hint(surface: pygame.Surface, font: pygame.font.Font) -> pygame.Rect:
     text = "H for help"
-    s = font.render(text, True, settings.COLOR_TEXT_MUTED)
+    s = render_text_cached(font, text, True, settings.COLOR_TEXT_MUTED)
     rect = s.get_rect(bottomright=(surface.get_width() - 18, surface.get_height() - 18))
     surface.blit(s, rect)
+    return rect
@@ -11,7 +11,7 @@ from config import settings
 
 from src.models.task import QuizTask
 from src.views.base_renderer import BaseRenderer
-from src.services.renderer_utils import wrap_text, draw_text_centered_shadow, extract_matrix_block
+from src.services.renderer_utils import wrap_text, draw_text_centered_shadow, extract_matrix_block, render_text_cached
 from src.services.ui_metrics import content_center_y_offset, content_max_width, pad_large, pad_medium, pad_small, border_width
 from src.services.ui_scale import ui_scale
 import pygame
@@ -42,20 +42,26 @@ class QuizRenderer(BaseRenderer):
         question_start_y = (
             self.screen_rect.height // 2
             + content_center_y_offset()
-            - (len(question_lines) * self.font_title.get_linesize() // 2)
+            - (len(question_lines) * self._linesize_title // 2)
         )
 
+        # Bind loop-invariant lookups once; the per-line loops below run
+        # every frame.
+        screen = self.screen
+        pad_s = pad_small()
+        accent = settings.COLOR_ACCENT_QUIZ
+
         current_y = question_start_y
-        line_h = self.font_title.get_linesize()
+        line_step = self._linesize_title + pad_s
         for line in question_lines:
             draw_text_centered_shadow(
-                self.screen,
+                screen,
                 line,
                 self.font_title,
-                settings.COLOR_ACCENT_QUIZ,
+                accent,
                 current_y,
             )
-            current_y += line_h + pad_small()
+            current_y += line_step
 
         if matrix_lines:
             current_y += pad_medium()
@@ -66,17 +72,18 @@ class QuizRenderer(BaseRenderer):
         if show_note and task.note:
             current_y += pad_medium()
             note_lines = wrap_text(task.note, self.font_body, max_width, hard_wrap=True)
-            body_h = self.font_body.get_linesize()
+            note_color = settings.QUIZ_NOTE_COLOR
+            note_step = self._linesize_body + pad_s
 
             for line in note_lines:
                 draw_text_centered_shadow(
-                    self.screen,
+                    screen,
                     line,
                     self.font_body,
-                    settings.QUIZ_NOTE_COLOR,
+                    note_color,
                     current_y,
                 )
-                current_y += body_h + pad_small()
+                current_y += note_step
 
     def _render_matrix_box(self, lines: list[str], start_y: int, max_width: int) -> None:
         """Render a matrix-like text block in monospace so columns align."""
@@ -95,7 +102,7 @@ class QuizRenderer(BaseRenderer):
         max_line_w = 0
         for line in lines:
             display_line = line if line.strip() else " "
-            s = self.font_mono.render(display_line, True, settings.COLOR_TEXT_PRIMARY)
+            s = render_text_cached(self.font_mono, display_line, True, settings.COLOR_TEXT_PRIMARY)
             rendered.append(s)
             max_line_w = max(max_line_w, s.get_width())
 
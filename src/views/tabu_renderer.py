@@ -8,10 +8,11 @@ Design principle: Visual clarity for game rules.
 """
 
 import pygame
+from collections import OrderedDict, deque
 from config import settings
 from src.models.task import TabuTask
 from src.views.base_renderer import BaseRenderer
-from src.services.renderer_utils import draw_text_centered, draw_bordered_box
+from src.services.renderer_utils import draw_text_centered, render_text_cached
 from src.services.ui_metrics import content_center_y_offset, content_max_width, pad_large, pad_medium, pad_small, border_width
 
 
@@ -26,6 +27,17 @@ class TabuRenderer(BaseRenderer):
     - Red glow effect behind content
     """
 
+    # Composed word boxes are one-line sized; a handful covers the
+    # session's Tabu tasks while bounding memory.
+    _BOX_CACHE_MAX = 8
+
+    def __init__(self, screen: pygame.Surface):
+        super().__init__(screen)
+        # Fully composed forbidden-word boxes (fill + border + text) keyed
+        # by word list, so a stable task costs one blit per frame instead
+        # of re-joining, measuring and layouting every flip.
+        self._box_cache: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+
     def get_glow_config(self, task: TabuTask) -> dict:
         """
         Configure red glow for tabu tasks.
@@ -65,7 +77,7 @@ class TabuRenderer(BaseRenderer):
         )
 
         # Spacing before forbidden words section
-        forbidden_y = start_y + self.font_title.get_linesize() + pad_large()
+        forbidden_y = start_y + self._linesize_title + pad_large()
 
         # Render "Forbidden words" label
         draw_text_centered(
@@ -79,7 +91,7 @@ class TabuRenderer(BaseRenderer):
         # Render forbidden words in a box
         self._render_forbidden_box(
             task.forbidden_words,
-            forbidden_y + self.font_subtitle.get_linesize() + pad_medium()
+            forbidden_y + self._linesize_subtitle + pad_medium()
         )
 
     def _render_placeholder(self) -> None:
@@ -101,76 +113,124 @@ class TabuRenderer(BaseRenderer):
             "Press V to reveal",
             self.font_body,
             settings.COLOR_TEXT_MUTED,
-            start_y + self.font_title.get_linesize() + pad_medium(),
+            start_y + self._linesize_title + pad_medium(),
         )
 
     def _render_forbidden_box(self, words: list, start_y: int) -> None:
-        """
-        Render forbidden words in a bordered box.
+        """Render forbidden words in a bordered box.
+
+        The complete box (fill, border, text - or the multi-line fallback)
+        is composed once per word list and cached, so repeated frames pay
+        one screen blit.
 
         Args:
             words: List of forbidden words
             start_y: Top Y position for the box
         """
-        # Join words with bullets
-        word_text = "  •  ".join(words)
+        key = tuple(words)
+        box = self._box_cache.get(key)
+        if box is None:
+            box = self._compose_forbidden_box(words)
+            self._box_cache[key] = box
+            if len(self._box_cache) > self._BOX_CACHE_MAX:
+                self._box_cache.popitem(last=False)
+        else:
+            self._box_cache.move_to_end(key)
+
+        box_x = (self.screen_rect.width - box.get_width()) // 2
+        self.screen.blit(box, (box_x, start_y))
+
+    def _compose_forbidden_box(self, words: list) -> pygame.Surface:
+        """Build the forbidden-words surface for a word list."""
+        separator = "  •  "
 
-        # Calculate box dimensions
         max_width = min(
             content_max_width(),
             self.screen_rect.width - (pad_large() * 2)
         )
 
-        # Render word text
-        word_surface = self.font_body.render(
-            word_text,
-            True,
-            settings.COLOR_ACCENT_TABU
-        )
-
-        # Check if text fits on one line
-        if word_surface.get_width() > max_width:
-            # Split into multiple lines if too wide
-            # Simple approach: split in half
-            mid = len(words) // 2
-            line1 = "  •  ".join(words[:mid])
-            line2 = "  •  ".join(words[mid:])
-
-            # Render both lines
-            current_y = start_y + pad_medium()
-            for line in [line1, line2]:
-                draw_text_centered(
-                    self.screen,
-                    line,
-                    self.font_body,
-                    settings.COLOR_ACCENT_TABU,
-                    current_y
-                )
-                current_y += self.font_body.get_linesize() + pad_small()
-
-        else:
-            box_padding = pad_medium()
-
-            # Create box around text
-            box_width = word_surface.get_width() + (box_padding * 2)
-            box_height = word_surface.get_height() + (box_padding * 2)
-
-            box_rect = pygame.Rect(
-                (self.screen_rect.width - box_width) // 2,
-                start_y,
-                box_width,
-                box_height
-            )
-
-            # Draw bordered box
-            draw_bordered_box(
-                self.screen,
-                box_rect,
-                settings.COLOR_SURFACE,
+        # Decide breaks by summed per-word advances like wrap_text does,
+        # then verify each assembled line with one exact font.size call:
+        # kerning and shaping mean the sum can under- or overestimate the
+        # rendered width, so trailing words are demoted on true overflow.
+        # Unlike the old split-in-half fallback there is no throwaway
+        # full-string render, and packed lines are guaranteed to fit.
+        size = self.font_body.size
+        sep_w = size(separator)[0]
+
+        lines: list = []
+        current: list = []
+        current_w = 0
+        queue = deque(words)
+        while queue:
+            word = queue.popleft()
+            w = size(word)[0]
+            test_w = w if not current else current_w + sep_w + w
+
+            if test_w <= max_width or not current:
+                current.append(word)
+                current_w = test_w
+                if queue:
+                    continue
+            else:
+                queue.appendleft(word)
+
+            # Close the line; demoted words re-enter the queue in order.
+            while len(current) > 1 and size(separator.join(current))[0] > max_width:
+                queue.appendleft(current.pop())
+            lines.append(separator.join(current))
+            current = []
+            current_w = 0
+
+        if not lines:
+            lines.append("")
+
+        if len(lines) == 1:
+            word_surface = render_text_cached(
+                self.font_body,
+                lines[0],
+                True,
                 settings.COLOR_ACCENT_TABU,
-                border_width()
             )
-
-            # Draw text inside box
-            text_rect = word_surface.get_rect(center=box_rect.center)
-            self.screen.blit(word_surface, text_rect)
+        else:
+            line_surfaces = [
+                render_text_cached(self.font_body, line, True, settings.COLOR_ACCENT_TABU)
+                for line in lines
+            ]
+
+            line_step = self._linesize_body + pad_small()
+            block_w = max(s.get_width() for s in line_surfaces)
+            # Transparent top padding keeps the on-screen position the
+            # multi-line variant used before it was composed off-screen.
+            block_h = pad_medium() + line_step * (len(line_surfaces) - 1) + line_surfaces[-1].get_height()
+
+            block = pygame.Surface((block_w, block_h), pygame.SRCALPHA)
+            current_y = pad_medium()
+            line_blits = []
+            for s in line_surfaces:
+                line_blits.append((s, ((block_w - s.get_width()) // 2, current_y)))
+                current_y += line_step
+            block.blits(line_blits, doreturn=False)
+
+            try:
+                return block.convert_alpha()
+            except pygame.error:
+                return block
+
+        box_padding = pad_medium()
+        box_width = word_surface.get_width() + (box_padding * 2)
+        box_height = word_surface.get_height() + (box_padding * 2)
+
+        box = pygame.Surface((box_width, box_height), pygame.SRCALPHA)
+        box_rect = box.get_rect()
+
+        pygame.draw.rect(box, settings.COLOR_SURFACE, box_rect)
+        pygame.draw.rect(box, settings.COLOR_ACCENT_TABU, box_rect, border_width())
+
+        text_rect = word_surface.get_rect(center=box_rect.center)
+        box.blit(word_surface, text_rect)
+
+        try:
+            return box.convert_alpha()
+        except pygame.error:
+            return box
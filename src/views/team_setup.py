@@ -19,21 +19,59 @@ Contract
 
 from __future__ import annotations
 
+import string
+
 import pygame
 
 from config import settings
-from src.services.renderer_utils import draw_text_centered_shadow
+from src.services.renderer_utils import render_text_cached
+from src.services.text_normalize import normalize_text
+
+
+# Default names for newly added teams, one per supported slot.
+_TEAM_LETTERS = tuple(f"Team {c}" for c in string.ascii_uppercase[:8])
+
+
+# SysFont construction scans font files on first use; share one font per
+# (family, size, bold) across run_team_setup invocations.
+_FONT_CACHE: dict = {}
+
+
+def _get_font(family: str, size: int, bold: bool = False) -> pygame.font.Font:
+    key = (family, size, bold)
+    font = _FONT_CACHE.get(key)
+    if font is None:
+        font = pygame.font.SysFont(family, size, bold=bold)
+        _FONT_CACHE[key] = font
+    return font
 
 
 def run_team_setup(screen: pygame.Surface, clock: pygame.time.Clock) -> list[str] | None:
     pygame.key.set_repeat(250, 35)
 
+    # Only QUIT and KEYDOWN matter on this screen; blocking the rest keeps
+    # mouse-motion and window events from being wrapped into Python event
+    # objects just to be skipped. The full set is restored on exit.
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN])
+    try:
+        return _run_team_setup_loop(screen, clock)
+    finally:
+        pygame.event.set_allowed(None)
+
+
+def _run_team_setup_loop(screen: pygame.Surface, clock: pygame.time.Clock) -> list[str] | None:
     count = 4
     names = ["Team A", "Team B", "Team C", "Team D"]
     active_idx = 0
 
-    font_title = pygame.font.SysFont(settings.FONT_FAMILY_PRIMARY, 56, bold=True)
-    font_body = pygame.font.SysFont(settings.FONT_FAMILY_PRIMARY, 32)
+    font_title = _get_font(settings.FONT_FAMILY_PRIMARY, 56, bold=True)
+    font_body = _get_font(settings.FONT_FAMILY_PRIMARY, 32)
+
+    # Nothing on this screen moves on its own, so a frame only needs to be
+    # drawn after an event actually changed count/names/active_idx. Between
+    # keypresses the loop is just event polling plus clock.tick.
+    needs_redraw = True
 
     while True:
         for event in pygame.event.get():
@@ -49,12 +87,14 @@ def run_team_setup(screen: pygame.Surface, clock: pygame.time.Clock) -> list[str
             if event.key == pygame.K_DOWN:
                 count = min(8, count + 1)
                 while len(names) < count:
-                    names.append(f"Team {chr(ord('A') + len(names))}")
+                    names.append(_TEAM_LETTERS[len(names)])
                 active_idx = min(active_idx, count - 1)
+                needs_redraw = True
 
             elif event.key == pygame.K_UP:
                 count = max(2, count - 1)
                 active_idx = min(active_idx, count - 1)
+                needs_redraw = True
 
             elif event.key in (pygame.K_TAB, pygame.K_RETURN):
                 if event.key == pygame.K_RETURN:
@@ -66,39 +106,60 @@ def run_team_setup(screen: pygame.Surface, clock: pygame.time.Clock) -> list[str
                         return cleaned
                 else:
                     active_idx = (active_idx + 1) % count
+                    needs_redraw = True
 
             elif event.key == pygame.K_BACKSPACE:
                 names[active_idx] = names[active_idx][:-1]
+                needs_redraw = True
 
             else:
-                if event.unicode and event.unicode.isprintable():
+                # A plain ordinal check (past the C0 controls, not DEL)
+                # covers text entry without the per-keystroke Unicode
+                # property lookup isprintable() does.
+                if event.unicode and event.unicode >= " " and event.unicode != "\x7f":
                     # small cap to avoid ridiculous inputs
                     if len(names[active_idx]) < 20:
                         names[active_idx] += event.unicode
+                        needs_redraw = True
+
+        if not needs_redraw:
+            clock.tick(settings.FPS)
+            continue
+        needs_redraw = False
 
         # --- render ---
         screen.fill(settings.COLOR_BACKGROUND)
-        draw_text_centered_shadow(screen, "WOW MODE — Team Setup", font_title, settings.COLOR_TEXT_PRIMARY, 60)
+
+        # Collect every label (shadow + text pair, centered) and push them
+        # through one blits() call - a single Python->C crossing instead of
+        # two blits per label.
+        centerx = screen.get_width() // 2
+        blits: list[tuple[pygame.Surface, pygame.Rect]] = []
+
+        def queue_label(text: str, font: pygame.font.Font, color, y: int) -> None:
+            text = normalize_text(text)
+            shadow = render_text_cached(font, text, True, (0, 0, 0))
+            front = render_text_cached(font, text, True, color)
+            blits.append((shadow, shadow.get_rect(centerx=centerx + 2, top=y + 2)))
+            blits.append((front, front.get_rect(centerx=centerx, top=y)))
+
+        queue_label("WOW MODE — Team Setup", font_title, settings.COLOR_TEXT_PRIMARY, 60)
 
         hint = "↓/↑ Teams   TAB Next name   ENTER Start   ESC Quit"
-        draw_text_centered_shadow(screen, hint, font_body, settings.COLOR_TEXT_MUTED, 120)
+        queue_label(hint, font_body, settings.COLOR_TEXT_MUTED, 120)
 
-        draw_text_centered_shadow(
-            screen,
-            f"Teams: {count}",
-            font_body,
-            settings.COLOR_TEXT_SECONDARY,
-            180,
-        )
+        queue_label(f"Teams: {count}", font_body, settings.COLOR_TEXT_SECONDARY, 180)
 
         y = 260
         for i in range(count):
             prefix = ">" if i == active_idx else " "
             text = f"{prefix} {i+1}. {names[i]}"
             color = settings.COLOR_ACCENT_QUIZ if i == active_idx else settings.COLOR_TEXT_PRIMARY
-            draw_text_centered_shadow(screen, text, font_body, color, y)
+            queue_label(text, font_body, color, y)
             y += 48
 
+        screen.blits(blits, doreturn=False)
+
         pygame.display.flip()
         clock.tick(settings.FPS)
 
@@ -11,7 +11,7 @@ def test_award_blocked_team_does_not_consume_award() -> None:
     scoring = ScoringState()
 
     # Block team 0
-    gs.buzz_blocked_teams.add(0)
+    gs.buzz_blocked_mask |= 1 << 0
 
     # Attempt to award to blocked team should not mark awarded
     assert scoring.is_awarded(0) is False
@@ -14,7 +14,7 @@ def test_fail_blocks_team_and_reopens_buzz() -> None:
     gs.fail_locked_team_and_reopen()
     assert gs.buzz_state == BuzzState.OPEN
     assert gs.buzz_locked_team is None
-    assert 0 in gs.buzz_blocked_teams
+    assert gs.is_team_blocked(0)
 
     # blocked team can't re-buzz
     assert gs.buzz(0) is False
@@ -28,8 +28,8 @@ def test_reset_buzz_clears_blocks() -> None:
     gs.open_buzz()
     gs.buzz(0)
     gs.fail_locked_team_and_reopen()
-    assert gs.buzz_blocked_teams
+    assert gs.buzz_blocked_mask
 
     gs.reset_buzz()
-    assert gs.buzz_blocked_teams == set()
+    assert gs.buzz_blocked_mask == 0
 
@@ -103,3 +103,32 @@ def test_with_teams_requires_at_least_one_name() -> None:
     with pytest.raises(ValueError):
         GameState.with_teams(["  ", ""])
 
+
+
+def test_apply_replays_command_stream_deterministically() -> None:
+    stream = [
+        ("open_buzz", {}, 1000),
+        ("buzz", {"team_index": 1}, 1100),
+        ("add_points", {"team_index": 1, "points": 200}, 1200),
+        ("fail_locked_team_and_reopen", {}, 1300),
+        ("timer_start_pause_toggle", {}, 1400),
+    ]
+
+    replays = []
+    for _ in range(2):
+        gs = GameState.with_teams(["Alpha", "Beta"])
+        for command, params, now_ms in stream:
+            gs.apply(command, params, now_ms=now_ms)
+        replays.append(gs)
+
+    first, second = replays
+    assert first.to_dict() == second.to_dict()
+    assert [t.score for t in first.teams] == [0, 200]
+    assert first.buzz_state == BuzzState.OPEN
+    assert first.is_team_blocked(1)
+
+
+def test_apply_rejects_unknown_command() -> None:
+    gs = GameState.with_teams(["Alpha"])
+    with pytest.raises(ValueError):
+        gs.apply("warp_time")
@@ -1,5 +1,7 @@
+import hashlib
 import json
-from pathlib import Path
+import re
+from operator import attrgetter
 
 import pytest
 
@@ -8,15 +10,37 @@ from src.models.session import Session
 from src.services.task_loader import TaskLoader, TaskLoadError
 
 
-def _write_json(tmp_path: Path, payload) -> str:
-    path = tmp_path / "tasks.json"
-    path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
-    return str(path)
+# Compiled once; pytest.raises(match=...) accepts a pre-compiled pattern.
+_RE_UNKNOWN_TYPE = re.compile(r"Invalid task at index 0: Unknown task type")
+_RE_QUESTION_REQUIRED = re.compile(r"Field 'question' must be a non-empty string")
+_RE_FORBIDDEN_WORDS = re.compile(r"Field 'forbidden_words' must be a non-empty array of strings")
 
 
-def test_task_loader_happy_path(tmp_path: Path) -> None:
-    task_file = _write_json(
-        tmp_path,
+@pytest.fixture(scope="session")
+def write_json(tmp_path_factory: pytest.TempPathFactory):
+    """Write a payload to a JSON file once per session, keyed by content.
+
+    The payloads here are small and immutable, so identical payloads share
+    one file instead of re-serializing and re-writing per test.
+    """
+    base = tmp_path_factory.mktemp("tasks")
+    written: dict[str, str] = {}
+
+    def _write(payload) -> str:
+        raw = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        digest = hashlib.sha1(raw).hexdigest()[:16]
+        path = written.get(digest)
+        if path is None:
+            path = str(base / f"{digest}.json")
+            (base / f"{digest}.json").write_bytes(raw)
+            written[digest] = path
+        return path
+
+    return _write
+
+
+def test_task_loader_happy_path(write_json) -> None:
+    task_file = write_json(
         [
             {"type": "quiz", "category": "Theo Inf", "question": "What is Big-O?", "points": 300},
             {"type": "tabu", "category": "Theo Inf", "topic": "Databases", "forbidden_words": ["SQL", "table"], "points": 200},
@@ -29,55 +53,55 @@ def test_task_loader_happy_path(tmp_path: Path) -> None:
     tasks = TaskLoader.load_tasks(task_file)
 
     assert len(tasks) == 5
-    assert [t.type for t in tasks] == ["quiz", "tabu", "discussion", "code", "explain_to"]
-    assert [t.id for t in tasks] == [0, 1, 2, 3, 4]
-    assert [t.points for t in tasks] == [300, 200, 100, 400, 500]
+    assert list(map(attrgetter("type"), tasks)) == ["quiz", "tabu", "discussion", "code", "explain_to"]
+    assert list(map(attrgetter("id"), tasks)) == [0, 1, 2, 3, 4]
+    assert list(map(attrgetter("points"), tasks)) == [300, 200, 100, 400, 500]
     assert all(t.category == "Theo Inf" for t in tasks)
 
 
-def test_task_loader_legacy_difficulty_is_converted_to_points(tmp_path: Path) -> None:
-    task_file = _write_json(tmp_path, [{"type": "quiz", "category": "Theo Inf", "question": "Q", "difficulty": 3}])
+def test_task_loader_legacy_difficulty_is_converted_to_points(write_json) -> None:
+    task_file = write_json([{"type": "quiz", "category": "Theo Inf", "question": "Q", "difficulty": 3}])
     tasks = TaskLoader.load_tasks(task_file)
     assert tasks[0].points == 300
 
 
-def test_task_loader_missing_category(tmp_path: Path) -> None:
-    task_file = _write_json(tmp_path, [{"type": "quiz", "question": "Q", "points": 100}])
+def test_task_loader_missing_category(write_json) -> None:
+    task_file = write_json([{"type": "quiz", "question": "Q", "points": 100}])
 
     with pytest.raises(TaskLoadError, match=r"category"):
         TaskLoader.load_tasks(task_file)
 
 
-def test_task_loader_unknown_type(tmp_path: Path) -> None:
-    task_file = _write_json(tmp_path, [{"type": "nope", "category": "Theo Inf", "question": "x", "points": 100}])
+def test_task_loader_unknown_type(write_json) -> None:
+    task_file = write_json([{"type": "nope", "category": "Theo Inf", "question": "x", "points": 100}])
 
-    with pytest.raises(TaskLoadError, match=r"Invalid task at index 0: Unknown task type"):
+    with pytest.raises(TaskLoadError, match=_RE_UNKNOWN_TYPE):
         TaskLoader.load_tasks(task_file)
 
 
-def test_task_loader_missing_required_field(tmp_path: Path) -> None:
-    task_file = _write_json(tmp_path, [{"type": "quiz", "category": "Theo Inf", "points": 100}])
+def test_task_loader_missing_required_field(write_json) -> None:
+    task_file = write_json([{"type": "quiz", "category": "Theo Inf", "points": 100}])
 
-    with pytest.raises(TaskLoadError, match=r"Field 'question' must be a non-empty string"):
+    with pytest.raises(TaskLoadError, match=_RE_QUESTION_REQUIRED):
         TaskLoader.load_tasks(task_file)
 
 
-def test_task_loader_wrong_type_field(tmp_path: Path) -> None:
-    task_file = _write_json(tmp_path, [{"type": "tabu", "category": "Theo Inf", "topic": "X", "forbidden_words": "SQL", "points": 100}])
+def test_task_loader_wrong_type_field(write_json) -> None:
+    task_file = write_json([{"type": "tabu", "category": "Theo Inf", "topic": "X", "forbidden_words": "SQL", "points": 100}])
 
-    with pytest.raises(TaskLoadError, match=r"Field 'forbidden_words' must be a non-empty array of strings"):
+    with pytest.raises(TaskLoadError, match=_RE_FORBIDDEN_WORDS):
         TaskLoader.load_tasks(task_file)
 
 
-def test_task_loader_missing_points(tmp_path: Path) -> None:
-    task_file = _write_json(tmp_path, [{"type": "quiz", "category": "Theo Inf", "question": "Q"}])
+def test_task_loader_missing_points(write_json) -> None:
+    task_file = write_json([{"type": "quiz", "category": "Theo Inf", "question": "Q"}])
 
     with pytest.raises(TaskLoadError, match=r"points.*required"):
         TaskLoader.load_tasks(task_file)
 
 
-def test_task_loader_invalid_points(tmp_path: Path) -> None:
-    task_file = _write_json(tmp_path, [{"type": "quiz", "category": "Theo Inf", "question": "Q", "points": 600}])
+def test_task_loader_invalid_points(write_json) -> None:
+    task_file = write_json([{"type": "quiz", "category": "Theo Inf", "question": "Q", "points": 600}])
 
     with pytest.raises(TaskLoadError, match=r"points.*100.*200.*300"):
         TaskLoader.load_tasks(task_file)
@@ -98,8 +122,8 @@ def test_session_wraparound_next_prev() -> None:
     assert session.is_first_task()
 
 
-def test_cli_validate_ok(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
-    task_file = _write_json(tmp_path, [{"type": "quiz", "category": "Theo Inf", "question": "Ok", "points": 100}])
+def test_cli_validate_ok(write_json, capsys: pytest.CaptureFixture[str]) -> None:
+    task_file = write_json([{"type": "quiz", "category": "Theo Inf", "question": "Ok", "points": 100}])
 
     code = cli_main(["validate", "--task-file", task_file])
 
@@ -108,8 +132,8 @@ def test_cli_validate_ok(tmp_path: Path, capsys: pytest.CaptureFixture[str]) ->
     assert "OK:" in captured.out
 
 
-def test_cli_validate_invalid(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
-    task_file = _write_json(tmp_path, [{"type": "quiz", "category": "Theo Inf", "question": "Ok"}])
+def test_cli_validate_invalid(write_json, capsys: pytest.CaptureFixture[str]) -> None:
+    task_file = write_json([{"type": "quiz", "category": "Theo Inf", "question": "Ok"}])
 
     code = cli_main(["validate", "--task-file", task_file])
 
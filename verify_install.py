@@ -5,70 +5,87 @@ Installation verification script for Spotlight.
 Run this after installation to verify everything is set up correctly.
 """
 
+import io
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 
-def check_python_version():
+def check_python_version(out=sys.stdout):
     """Check if Python version is 3.10 or higher."""
-    print("✓ Checking Python version...")
+    print("✓ Checking Python version...", file=out)
     version = sys.version_info
     if version.major < 3 or (version.major == 3 and version.minor < 10):
-        print(f"  ✗ Python 3.10+ required, found {version.major}.{version.minor}")
+        print(f"  ✗ Python 3.10+ required, found {version.major}.{version.minor}", file=out)
         return False
-    print(f"  ✓ Python {version.major}.{version.minor} - OK")
+    print(f"  ✓ Python {version.major}.{version.minor} - OK", file=out)
     return True
 
 
-def check_pygame():
+def check_pygame(out=sys.stdout):
     """Check if pygame is installed."""
-    print("✓ Checking pygame installation...")
+    print("✓ Checking pygame installation...", file=out)
     try:
         import pygame
-        print(f"  ✓ pygame {pygame.version.ver} - OK")
+        print(f"  ✓ pygame {pygame.version.ver} - OK", file=out)
         return True
     except ImportError:
-        print("  ✗ pygame not found")
-        print("  → Install with: pip install pygame")
+        print("  ✗ pygame not found", file=out)
+        print("  → Install with: pip install pygame", file=out)
         return False
 
 
-def check_task_file():
+def check_task_file(out=sys.stdout):
     """Check if tasks.json exists and is valid."""
-    print("✓ Checking task file...")
+    print("✓ Checking task file...", file=out)
     from pathlib import Path
     from src.services.task_loader import TaskLoader
-    
+
     task_file = Path("data/tasks.json")
-    
+
     if not task_file.exists():
-        print("  ✗ data/tasks.json not found")
+        print("  ✗ data/tasks.json not found", file=out)
         return False
-    
+
     try:
         tasks = TaskLoader.load_tasks(str(task_file))
-        print(f"  ✓ Loaded {len(tasks)} tasks - OK")
+        print(f"  ✓ Loaded {len(tasks)} tasks - OK", file=out)
         return True
     except Exception as e:
-        print(f"  ✗ Error loading tasks: {e}")
+        print(f"  ✗ Error loading tasks: {e}", file=out)
         return False
 
 
+def _run_buffered(check):
+    """Run a check against a private buffer so parallel output stays grouped."""
+    buf = io.StringIO()
+    ok = check(buf)
+    return ok, buf.getvalue()
+
+
 def main():
     """Run all verification checks."""
     print("=" * 60)
     print("Spotlight - Installation Verification")
     print("=" * 60)
     print()
-    
-    checks = [
-        check_python_version(),
-        check_pygame(),
-        check_task_file(),
-    ]
-    
+
+    # The version check is instant and everything depends on it, so it runs
+    # first. The other two overlap: the pygame import (hundreds of ms of
+    # module init) proceeds while the task file is read and parsed. Each
+    # parallel check prints into its own buffer, flushed in submission
+    # order, so output is identical to the sequential run.
+    checks = [check_python_version()]
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        futures = [pool.submit(_run_buffered, check) for check in (check_pygame, check_task_file)]
+        for future in futures:
+            ok, output = future.result()
+            checks.append(ok)
+            print(output, end="")
+
     print()
     print("=" * 60)
-    
+
     if all(checks):
         print("✓ All checks passed! Ready to run.")
         print()
@@ -77,7 +94,7 @@ def main():
     else:
         print("✗ Some checks failed. Please fix issues above.")
         sys.exit(1)
-    
+
     print("=" * 60)
 
 